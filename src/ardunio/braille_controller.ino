@@ -5,6 +5,8 @@
 #define SERVO_A_PIN 8    // Top servo pin
 #define SERVO_B_PIN 9    // Bottom servo pin
 #define MAX_INPUT_LENGTH 1000
+#define GROUP_SEPARATOR '\x1e'  // Separates character groups within one TEXT command
+#define RECORD_START 0xA5       // First byte of a binary character record
 
 // Create servo objects
 Servo myServoA;  // For top 3 bits (b5b4b3)
@@ -48,6 +50,7 @@ const char *braille_exclamation = "011010";
 
 // Mode flag
 bool dual_servo_mode = true;  // Default to dual servo mode
+bool binary_protocol = false; // Report characters as binary records instead of text
 
 // Function to convert a character to its 6-bit Braille representation
 uint8_t translate_braille_character(char c) {
@@ -80,8 +83,21 @@ uint8_t translate_braille_character(char c) {
     return pattern;
 }
 
+// Function to report a character as a binary record:
+// RECORD_START, char, pattern, pulse A (uint16 LE), pulse B (uint16 LE, 0 in single servo mode)
+void send_binary_record(char c, uint8_t pattern, unsigned int pulse_a, unsigned int pulse_b) {
+    uint8_t record[7] = {
+        RECORD_START,
+        (uint8_t)c,
+        pattern,
+        (uint8_t)(pulse_a & 0xFF), (uint8_t)(pulse_a >> 8),
+        (uint8_t)(pulse_b & 0xFF), (uint8_t)(pulse_b >> 8)
+    };
+    Serial.write(record, sizeof(record));
+}
+
 // Function to write a 6-bit Braille pattern using two servos
-void write_braille_character(uint8_t pattern) {
+void write_braille_character(char c, uint8_t pattern) {
     // Split the 6-bit pattern into two 3-bit patterns for each servo
     uint8_t servo_a_bits = (pattern >> 3) & 0x07;  // Top 3 bits (b5b4b3)
     uint8_t servo_b_bits = pattern & 0x07;         // Bottom 3 bits (b2b1b0)
@@ -101,22 +117,30 @@ void write_braille_character(uint8_t pattern) {
         myServoB.writeMicroseconds(844); // Home position
     }
 
-    // Debug output
-    Serial.print("Pattern: ");
-    Serial.print(pattern, BIN);
-    Serial.print(" Servo A (");
-    Serial.print(servo_a_bits, BIN);
-    Serial.print("): ");
-    Serial.print(pulse_a);
-    Serial.print("µs");
-    if (dual_servo_mode) {
-        Serial.print(", Servo B (");
-        Serial.print(servo_b_bits, BIN);
+    if (binary_protocol) {
+        // Compact record for the host
+        send_binary_record(c, pattern, pulse_a, dual_servo_mode ? pulse_b : 0);
+    } else {
+        // Debug output
+        Serial.print("Character: ");
+        Serial.print(c);
+        Serial.print(" -> ");
+        Serial.print("Pattern: ");
+        Serial.print(pattern, BIN);
+        Serial.print(" Servo A (");
+        Serial.print(servo_a_bits, BIN);
         Serial.print("): ");
-        Serial.print(pulse_b);
+        Serial.print(pulse_a);
         Serial.print("µs");
+        if (dual_servo_mode) {
+            Serial.print(", Servo B (");
+            Serial.print(servo_b_bits, BIN);
+            Serial.print("): ");
+            Serial.print(pulse_b);
+            Serial.print("µs");
+        }
+        Serial.println();
     }
-    Serial.println();
 
     // Add delay to allow servos to reach position
     delay(1000);
@@ -125,12 +149,13 @@ void write_braille_character(uint8_t pattern) {
 // Function to process an entire string
 void process_string(const char* input) {
     for (size_t i = 0; i < strlen(input); i++) {
+        // Group boundaries are only used by the host for display tracking
+        if (input[i] == GROUP_SEPARATOR) {
+            continue;
+        }
         char c = tolower(input[i]);  // Convert to lowercase
         uint8_t pattern = translate_braille_character(c);
-        Serial.print("Character: ");
-        Serial.print(c);
-        Serial.print(" -> ");
-        write_braille_character(pattern);
+        write_braille_character(c, pattern);
         delay(500);  // Delay between characters
     }
 }
@@ -173,6 +198,11 @@ void loop() {
                         Serial.println("Invalid Dual Servo Mode Command");
                     }
                 }
+                // Check if it's a protocol command
+                else if (strncmp(input_buffer, "CONFIG:BINARY=", 14) == 0) {
+                    binary_protocol = input_buffer[14] == '1';
+                    Serial.println(binary_protocol ? "Binary Protocol Enabled" : "Binary Protocol Disabled");
+                }
                 // Check if it's a text command
                 else if (strncmp(input_buffer, "TEXT:", 5) == 0) {
                     const char* text = input_buffer + 5;
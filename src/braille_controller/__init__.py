@@ -0,0 +1,3 @@
+"""
+Braille Controller Application package
+"""
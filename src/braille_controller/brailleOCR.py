@@ -2,113 +2,564 @@
 OCR Module for Braille Controller
 Handles text extraction from images using EasyOCR
 """
+import os
+import asyncio
+import hashlib
 import logging
-import easyocr
+import threading
+import cv2
 import numpy as np
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
 from PIL import Image
 from typing import Optional, List, Tuple
 
-# Initialize the reader at module level with specific parameters
 try:
-    reader = easyocr.Reader(
-        ['en'],
-        gpu=False,
-        model_storage_directory=None,
-        download_enabled=True,
-        recog_network='english_g2'
+    import onnxruntime as ort
+    from onnxruntime.quantization import (
+        CalibrationDataReader, QuantFormat, QuantType, quantize_dynamic, quantize_static
     )
-    logging.info("EasyOCR initialized successfully")
-except Exception as e:
-    reader = None
-    logging.error(f"Failed to initialize EasyOCR: {e}")
+except ImportError:
+    ort = None
+    CalibrationDataReader = object
 
-def preprocess_image(image_path: str) -> Image.Image:
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Directory (inside the EasyOCR model storage) holding exported ONNX graphs
+ONNX_SUBDIR = "onnx"
+DETECTOR_ONNX = "craft_detector"
+RECOGNIZER_ONNX = "english_g2_recognizer"
+
+# Calibration settings for static quantization of the recognizer
+CALIBRATION_DIR = Path(__file__).resolve().parents[2] / "image_bank"
+CALIBRATION_SAMPLES = 100
+RECOGNIZER_HEIGHT = 64
+CALIBRATION_WIDTH = 256
+
+# Number of detected text crops recognized per forward pass
+RECOGNIZER_BATCH_SIZE = 32
+
+# Files larger than this are decoded from a memory map instead of cv2.imread
+LARGE_IMAGE_BYTES = 10 * 1024 * 1024
+
+# Contrast enhancement used by preprocess_image. CLAHE.apply keeps scratch
+# buffers on the instance and is not thread-safe, so each thread gets its own.
+_clahe_local = threading.local()
+
+# OCR results keyed by (image content hash, confidence threshold)
+OCR_CACHE_SIZE = 128
+_ocr_cache: "OrderedDict[Tuple[str, float], str]" = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+
+# Default simultaneous batch OCR jobs. Each job's inference already uses
+# every core (ONNX Runtime / PyTorch intra-op threads), so more CPU jobs
+# only oversubscribe; on GPU a second job overlaps decode with inference.
+OCR_BATCH_CONCURRENCY_CPU = 1
+OCR_BATCH_CONCURRENCY_GPU = 2
+
+# Retry policy for batch OCR jobs
+OCR_MAX_ATTEMPTS = 3
+OCR_RETRY_BASE_DELAY = 0.5  # seconds, doubled after each failed attempt
+
+
+class OCRTransientError(RuntimeError):
+    """OCR inference failed in a way that may succeed on retry (e.g. out of memory)."""
+
+
+class _OnnxDetector:
+    """Drop-in replacement for the CRAFT detector backed by ONNX Runtime."""
+
+    def __init__(self, session: "ort.InferenceSession"):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+
+    def eval(self):
+        return self
+
+    def __call__(self, x):
+        import torch
+        y = self.session.run(None, {self.input_name: x.cpu().numpy()})[0]
+        return torch.from_numpy(y), None
+
+
+class _OnnxRecognizer:
+    """Drop-in replacement for the CRNN recognizer backed by ONNX Runtime."""
+
+    def __init__(self, session: "ort.InferenceSession"):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+
+    def eval(self):
+        return self
+
+    def __call__(self, image, text=None):
+        import torch
+        preds = self.session.run(None, {self.input_name: image.cpu().numpy()})[0]
+        return torch.from_numpy(preds)
+
+
+def _export_onnx_models(ocr_reader: "easyocr.Reader", model_dir: Path) -> Tuple[Path, Path]:
+    """
+    Export the EasyOCR detector and recognizer to FP32 ONNX graphs.
+    Args:
+        ocr_reader: Initialized (non-quantized) EasyOCR reader
+        model_dir: Directory to write the ONNX files to
+    Returns:
+        Tuple[Path, Path]: Paths of the detector and recognizer graphs
+    """
+    import torch
+
+    class _DetectorOutput(torch.nn.Module):
+        # CRAFT returns (score_map, feature); only the score map is used
+        def __init__(self, net):
+            super().__init__()
+            self.net = net
+
+        def forward(self, x):
+            return self.net(x)[0]
+
+    class _RecognizerOutput(torch.nn.Module):
+        # The CTC recognizer ignores its text argument at inference time
+        def __init__(self, net):
+            super().__init__()
+            self.net = net
+
+        def forward(self, x):
+            return self.net(x, None)
+
+    detector_path = model_dir / f"{DETECTOR_ONNX}.onnx"
+    recognizer_path = model_dir / f"{RECOGNIZER_ONNX}.onnx"
+
+    with torch.no_grad():
+        if not detector_path.exists():
+            torch.onnx.export(
+                _DetectorOutput(ocr_reader.detector).eval(),
+                torch.randn(1, 3, 640, 640),
+                str(detector_path),
+                input_names=["input"],
+                output_names=["score_map"],
+                dynamic_axes={"input": {0: "batch", 2: "height", 3: "width"},
+                              "score_map": {0: "batch", 1: "height", 2: "width"}},
+                opset_version=13
+            )
+            logging.info(f"Exported detector to {detector_path}")
+
+        if not recognizer_path.exists():
+            torch.onnx.export(
+                _RecognizerOutput(ocr_reader.recognizer).eval(),
+                torch.randn(1, 1, 64, 256),
+                str(recognizer_path),
+                input_names=["input"],
+                output_names=["preds"],
+                dynamic_axes={"input": {0: "batch", 3: "width"},
+                              "preds": {0: "batch", 1: "sequence"}},
+                opset_version=13
+            )
+            logging.info(f"Exported recognizer to {recognizer_path}")
+
+    return detector_path, recognizer_path
+
+
+def _quantize_model(model_path: Path) -> Path:
+    """Apply INT8 dynamic quantization to an ONNX graph, caching the result."""
+    quant_path = model_path.with_name(f"{model_path.stem}_int8.onnx")
+    if not quant_path.exists():
+        quantize_dynamic(
+            model_input=str(model_path),
+            model_output=str(quant_path),
+            weight_type=QuantType.QInt8
+        )
+        logging.info(f"Quantized {model_path.name} to {quant_path.name}")
+    return quant_path
+
+
+class _RecognizerCalibrationReader(CalibrationDataReader):
+    """Feeds preprocessed text crops to the static quantization calibrator."""
+
+    def __init__(self, ocr_reader: "easyocr.Reader", image_dir: Path,
+                 max_samples: int = CALIBRATION_SAMPLES):
+        self.samples = iter(self._collect_crops(ocr_reader, image_dir, max_samples))
+
+    @staticmethod
+    def _collect_crops(ocr_reader: "easyocr.Reader", image_dir: Path,
+                       max_samples: int) -> List[np.ndarray]:
+        """Detect text boxes in the sample images and normalize each crop."""
+        crops = []
+        image_paths = sorted(
+            path for path in image_dir.iterdir()
+            if path.suffix.lower() in (".png", ".jpg", ".jpeg", ".tiff")
+        )
+        for image_path in image_paths:
+            img = preprocess_image(str(image_path))
+            horizontal_list, _ = ocr_reader.detect(img)
+            for x_min, x_max, y_min, y_max in horizontal_list[0]:
+                crop = img[max(0, y_min):y_max, max(0, x_min):x_max]
+                if crop.size == 0:
+                    continue
+                height, width = crop.shape
+                new_width = max(1, min(CALIBRATION_WIDTH, round(width * RECOGNIZER_HEIGHT / height)))
+                resized = Image.fromarray(crop).resize((new_width, RECOGNIZER_HEIGHT), Image.BICUBIC)
+
+                # Same normalization/padding as EasyOCR's NormalizePAD:
+                # (x / 255 - 0.5) / 0.5, computed in place in float32
+                sample = np.asarray(resized, dtype=np.float32)
+                sample *= np.float32(2.0 / 255.0)
+                sample -= np.float32(1.0)
+                sample = np.pad(sample, ((0, 0), (0, CALIBRATION_WIDTH - new_width)), mode="edge")
+                crops.append(sample[np.newaxis, np.newaxis, :, :])
+                if len(crops) >= max_samples:
+                    return crops
+        return crops
+
+    def get_next(self) -> Optional[dict]:
+        sample = next(self.samples, None)
+        return None if sample is None else {"input": sample}
+
+
+def _quantize_recognizer_static(ocr_reader: "easyocr.Reader", model_path: Path) -> Optional[Path]:
+    """
+    Apply calibrated static INT8 quantization (QDQ, per-channel) to the recognizer.
+    Returns:
+        Optional[Path]: Quantized graph, or None if no calibration data was found
+    """
+    quant_path = model_path.with_name(f"{model_path.stem}_int8_static.onnx")
+    if quant_path.exists():
+        return quant_path
+
+    if not CALIBRATION_DIR.is_dir():
+        logging.warning(f"Calibration directory not found: {CALIBRATION_DIR}")
+        return None
+
+    calibration_reader = _RecognizerCalibrationReader(ocr_reader, CALIBRATION_DIR)
+    quantize_static(
+        str(model_path),
+        str(quant_path),
+        calibration_data_reader=calibration_reader,
+        quant_format=QuantFormat.QDQ,
+        per_channel=True,
+        activation_type=QuantType.QInt8,
+        weight_type=QuantType.QInt8,
+        op_types_to_quantize=["Conv", "MatMul", "Gemm"]
+    )
+    logging.info(f"Statically quantized {model_path.name} to {quant_path.name}")
+    return quant_path
+
+
+def _create_session(model_path: Path) -> "ort.InferenceSession":
+    """Create a CPU ONNX Runtime session using all available cores."""
+    sess_options = ort.SessionOptions()
+    sess_options.intra_op_num_threads = os.cpu_count() or 1
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(
+        str(model_path),
+        sess_options,
+        providers=["CPUExecutionProvider"]
+    )
+
+
+def _enable_onnx_backend(ocr_reader: "easyocr.Reader") -> None:
+    """
+    Swap the reader's PyTorch networks for INT8 ONNX Runtime sessions.
+    The EasyOCR pre- and post-processing (box detection, cropping, CTC
+    decoding) is reused unchanged; only the network forward passes move to ORT.
+    """
+    model_dir = Path(ocr_reader.model_storage_directory) / ONNX_SUBDIR
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    detector_path, recognizer_path = _export_onnx_models(ocr_reader, model_dir)
+
+    # The recognizer dominates OCR time, so prefer calibrated static INT8
+    try:
+        recognizer_quant_path = _quantize_recognizer_static(ocr_reader, recognizer_path)
+    except Exception as e:
+        logging.warning(f"Static quantization failed, using dynamic quantization: {e}")
+        recognizer_quant_path = None
+    if recognizer_quant_path is None:
+        recognizer_quant_path = _quantize_model(recognizer_path)
+
+    detector = _OnnxDetector(_create_session(_quantize_model(detector_path)))
+    recognizer = _OnnxRecognizer(_create_session(recognizer_quant_path))
+    ocr_reader.detector = detector
+    ocr_reader.recognizer = recognizer
+    logging.info("EasyOCR running on ONNX Runtime (INT8)")
+
+
+# EasyOCR reader, created on first use so importing this module stays cheap
+_reader = None
+_reader_lock = threading.Lock()
+
+
+def get_reader() -> "easyocr.Reader":
+    """
+    Get the process-wide EasyOCR reader, initializing it on first call.
+    All OCR callers should use this instead of constructing their own
+    easyocr.Reader, so the model weights are only loaded once.
+    Returns:
+        easyocr.Reader: Initialized reader
+    Raises:
+        Exception: If EasyOCR fails to initialize
+    """
+    global _reader
+    if _reader is not None:
+        return _reader
+
+    with _reader_lock:
+        if _reader is None:
+            import easyocr
+            import torch
+            use_gpu = torch.cuda.is_available()
+            ocr_reader = easyocr.Reader(
+                ['en'],
+                gpu=use_gpu,
+                cudnn_benchmark=use_gpu,  # Pick the fastest conv algorithms per input shape
+                model_storage_directory=None,
+                download_enabled=True,
+                recog_network='english_g2',
+                # Export needs the FP32 weights; ORT quantizes the graphs instead
+                quantize=ort is None
+            )
+            # The INT8 ONNX Runtime backend only targets CPU inference
+            if ort is not None and not use_gpu:
+                try:
+                    _enable_onnx_backend(ocr_reader)
+                except Exception as e:
+                    logging.warning(f"ONNX Runtime backend unavailable, using PyTorch: {e}")
+                    ocr_reader.detector = torch.quantization.quantize_dynamic(
+                        ocr_reader.detector, dtype=torch.qint8)
+                    ocr_reader.recognizer = torch.quantization.quantize_dynamic(
+                        ocr_reader.recognizer, dtype=torch.qint8)
+            _reader = ocr_reader
+            logging.info(f"EasyOCR initialized successfully on {ocr_reader.device}")
+    return _reader
+
+
+def warm_up(batch_size: int = 1) -> threading.Thread:
+    """
+    Initialize the OCR reader in a background thread so the first OCR call is fast.
+    On GPU a blank batch is also run through the pipeline so cuDNN settles
+    on its convolution algorithms before real images arrive.
+    Args:
+        batch_size: Number of blank images in the GPU warm-up batch
+    Returns:
+        threading.Thread: The started warm-up thread
+    """
+    def _load():
+        try:
+            ocr_reader = get_reader()
+            if ocr_reader.device != 'cpu':
+                ocr_reader.readtext_batched(np.zeros([batch_size, 600, 800, 3], np.uint8))
+                logging.debug("EasyOCR GPU warm-up completed")
+        except Exception as e:
+            logging.error(f"Failed to initialize EasyOCR: {e}")
+
+    thread = threading.Thread(target=_load, daemon=True)
+    thread.start()
+    return thread
+
+@lru_cache(maxsize=OCR_CACHE_SIZE)
+def _hash_file(image_path: str, mtime_ns: int, size: int) -> str:
+    """
+    Hash the contents of an image file.
+    The modification time and size are part of the cache key so an edited
+    file is hashed again instead of returning a stale digest.
+    """
+    with open(image_path, "rb") as f:
+        data = f.read()
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+def _read_grayscale(image_path: str) -> Optional[np.ndarray]:
+    """
+    Decode an image file to a grayscale array.
+    Large files are memory-mapped and decoded in place with cv2.imdecode,
+    avoiding a copy of the encoded bytes into a Python buffer.
+    Returns:
+        Optional[np.ndarray]: Grayscale image, or None if it cannot be decoded
+    """
+    if os.path.getsize(image_path) > LARGE_IMAGE_BYTES:
+        buffer = np.memmap(image_path, dtype=np.uint8, mode="r")
+        return cv2.imdecode(buffer, cv2.IMREAD_GRAYSCALE)
+    return cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+
+def _get_clahe() -> "cv2.CLAHE":
+    """Return this thread's CLAHE instance, creating it on first use."""
+    clahe = getattr(_clahe_local, "clahe", None)
+    if clahe is None:
+        clahe = _clahe_local.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+    return clahe
+
+def preprocess_image(image_path: str) -> np.ndarray:
     """
     Preprocess image for better OCR results.
+    Returns:
+        np.ndarray: Contrast-enhanced grayscale image (uint8, HxW)
     """
     try:
-        # Open image and convert to grayscale
-        img = Image.open(image_path).convert('L')
-        
-        # Convert to numpy array for processing
-        img_array = np.array(img)
-        
-        # Basic contrast enhancement
-        p2 = np.percentile(img_array, 2)
-        p98 = np.percentile(img_array, 98)
-        img_array = np.clip(img_array, p2, p98)
-        img_array = ((img_array - p2) / (p98 - p2) * 255).astype(np.uint8)
+        # Open image as grayscale
+        img_array = _read_grayscale(image_path)
+        if img_array is None:
+            raise ValueError(f"Unable to read image: {image_path}")
         
-        # Convert back to PIL Image
-        enhanced_img = Image.fromarray(img_array)
+        # Local contrast enhancement
+        img_array = _get_clahe().apply(img_array)
         logging.debug("Image preprocessing completed")
-        return enhanced_img
+        return img_array
         
     except Exception as e:
         logging.error(f"Error during image preprocessing: {e}")
         raise
 
+def _run_ocr(image_path: str, confidence_threshold: float) -> str:
+    """Run preprocessing, OCR and confidence filtering on a single image."""
+    try:
+        reader = get_reader()
+    except Exception as e:
+        raise RuntimeError(f"EasyOCR not properly initialized: {e}")
+    
+    logging.debug(f"Processing image: {image_path}")
+    
+    # Preprocess image
+    try:
+        preprocessed_image = preprocess_image(image_path)
+        logging.debug("Image preprocessing successful")
+    except Exception as e:
+        logging.error(f"Image preprocessing failed: {e}")
+        # Fall back to the unenhanced grayscale image; passing the path
+        # would make EasyOCR decode the file twice (colour and grayscale)
+        try:
+            preprocessed_image = _read_grayscale(image_path)
+        except OSError:
+            preprocessed_image = None
+        if preprocessed_image is None:
+            preprocessed_image = image_path
+    
+    # Run OCR with multiple detection parameters. Contrast is already
+    # enhanced by preprocess_image (CLAHE, before detection), so EasyOCR's
+    # second contrast-adjusted recognition pass is disabled.
+    try:
+        result = reader.readtext(
+            preprocessed_image,
+            contrast_ths=0,  # Skip the low-contrast re-recognition pass
+            width_ths=0.7,  # Width threshold for text boxes
+            height_ths=0.7,  # Height threshold for text boxes
+            batch_size=RECOGNIZER_BATCH_SIZE,  # Recognize crops as padded batches
+        )
+    except (RuntimeError, MemoryError) as e:
+        # Inference backend failures (CUDA/ONNX Runtime, allocation) can be
+        # momentary; input errors surface earlier and are not retried
+        raise OCRTransientError(f"OCR inference failed: {e}") from e
+    
+    extracted_text = []
+    for bbox, text, prob in result:
+        logging.debug(f"Found text: '{text}' with confidence {prob:.3f}")
+        if prob > confidence_threshold:
+            cleaned_text = text.strip()
+            if cleaned_text:
+                extracted_text.append(cleaned_text)
+                logging.debug(f"Accepted text: '{cleaned_text}' (confidence: {prob:.3f})")
+        else:
+            logging.debug(f"Rejected text: '{text}' due to low confidence {prob:.3f}")
+    
+    if extracted_text:
+        final_text = ' '.join(extracted_text)
+        # Clean up the text
+        final_text = ' '.join(final_text.split())  # Remove extra whitespace
+        final_text_ascii = final_text.encode('ascii', 'ignore').decode('ascii')
+        logging.info(f"Successfully extracted text: {final_text_ascii}")
+        return final_text_ascii
+    else:
+        logging.warning("No text found with sufficient confidence")
+        return ""
+
 def extract_text_from_image(image_path: str, confidence_threshold: float = 0.3) -> str:
     """
     Extract text from an image using EasyOCR.
+    Results are cached by image content, so repeated calls on the same
+    image skip OCR entirely.
     Args:
         image_path: Path to the image file
         confidence_threshold: Minimum confidence score for text detection (0-1)
     Returns:
         str: Extracted text or error message
+    Raises:
+        OCRTransientError: If inference failed in a way that may succeed on retry
+        RuntimeError: For any other failure
     """
     try:
-        if reader is None:
-            raise RuntimeError("EasyOCR not properly initialized")
-        
-        logging.debug(f"Processing image: {image_path}")
-        
-        # Preprocess image
-        try:
-            preprocessed_image = preprocess_image(image_path)
-            logging.debug("Image preprocessing successful")
-        except Exception as e:
-            logging.error(f"Image preprocessing failed: {e}")
-            # Fall back to original image if preprocessing fails
-            preprocessed_image = image_path
-        
-        # Run OCR with multiple detection parameters
-        result = reader.readtext(
-            preprocessed_image,
-            paragraph=True,  # Group text into paragraphs
-            contrast_ths=0.1,  # Lower contrast threshold
-            adjust_contrast=0.5,  # Adjust image contrast
-            width_ths=0.7,  # Width threshold for text boxes
-            height_ths=0.7,  # Height threshold for text boxes
-        )
-        
-        extracted_text = []
-        for bbox, text, prob in result:
-            logging.debug(f"Found text: '{text}' with confidence {prob:.3f}")
-            if prob > confidence_threshold:
-                cleaned_text = text.strip()
-                if cleaned_text:
-                    extracted_text.append(cleaned_text)
-                    logging.debug(f"Accepted text: '{cleaned_text}' (confidence: {prob:.3f})")
-            else:
-                logging.debug(f"Rejected text: '{text}' due to low confidence {prob:.3f}")
-        
-        if extracted_text:
-            final_text = ' '.join(extracted_text)
-            # Clean up the text
-            final_text = ' '.join(final_text.split())  # Remove extra whitespace
-            final_text_ascii = final_text.encode('ascii', 'ignore').decode('ascii')
-            logging.info(f"Successfully extracted text: {final_text_ascii}")
-            return final_text_ascii
-        else:
-            logging.warning("No text found with sufficient confidence")
-            return ""
-            
+        stat = os.stat(image_path)
+        cache_key = (_hash_file(image_path, stat.st_mtime_ns, stat.st_size), confidence_threshold)
+        with _ocr_cache_lock:
+            if cache_key in _ocr_cache:
+                _ocr_cache.move_to_end(cache_key)
+                logging.debug(f"Using cached OCR result for {image_path}")
+                return _ocr_cache[cache_key]
+
+        text = _run_ocr(image_path, confidence_threshold)
+
+        with _ocr_cache_lock:
+            _ocr_cache[cache_key] = text
+            if len(_ocr_cache) > OCR_CACHE_SIZE:
+                _ocr_cache.popitem(last=False)
+        return text
+
+    except OCRTransientError as e:
+        logging.error(f"Error processing image: {e}")
+        raise
     except Exception as e:
         error_msg = f"Error processing image: {str(e)}"
         logging.error(error_msg)
         raise RuntimeError(error_msg)
 
+async def extract_text_batch(image_paths: List[str], confidence_threshold: float = 0.3,
+                             max_concurrency: Optional[int] = None) -> List[str]:
+    """
+    Extract text from several images concurrently.
+    Each image runs through extract_text_from_image in the default executor,
+    with at most max_concurrency images in flight. Images failing with
+    OCRTransientError are retried with exponential backoff before the error
+    is raised; other errors (missing or undecodable files, reader
+    initialization) fail immediately.
+    Args:
+        image_paths: Paths to the image files
+        confidence_threshold: Minimum confidence score for text detection (0-1)
+        max_concurrency: Maximum simultaneous OCR jobs (defaults to
+            OCR_BATCH_CONCURRENCY_CPU or OCR_BATCH_CONCURRENCY_GPU for the
+            reader's device)
+    Returns:
+        List[str]: Extracted text for each image, in input order
+    """
+    loop = asyncio.get_running_loop()
+    if not max_concurrency:
+        ocr_reader = await loop.run_in_executor(None, get_reader)
+        max_concurrency = (OCR_BATCH_CONCURRENCY_CPU if ocr_reader.device == 'cpu'
+                           else OCR_BATCH_CONCURRENCY_GPU)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _extract(image_path: str) -> str:
+        for attempt in range(OCR_MAX_ATTEMPTS):
+            try:
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        None, extract_text_from_image, image_path, confidence_threshold)
+            except OCRTransientError as e:
+                if attempt == OCR_MAX_ATTEMPTS - 1:
+                    raise
+                delay = 2 ** attempt * OCR_RETRY_BASE_DELAY
+                logging.warning(f"OCR attempt {attempt + 1} failed for {image_path}, retrying in {delay}s: {e}")
+                await asyncio.sleep(delay)
+
+    return await asyncio.gather(*(_extract(path) for path in image_paths))
+
 def is_available() -> bool:
     """Check if OCR functionality is available."""
-    return reader is not None
\ No newline at end of file
+    try:
+        get_reader()
+        return True
+    except Exception as e:
+        logging.error(f"Failed to initialize EasyOCR: {e}")
+        return False
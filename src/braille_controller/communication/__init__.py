@@ -0,0 +1,3 @@
+"""
+Serial communication with the Braille display Arduino
+"""
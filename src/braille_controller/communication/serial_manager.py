@@ -5,26 +5,72 @@ Handles all serial communication with the Arduino device
 
 import serial
 import serial.tools.list_ports
+import queue
+import struct
+import sys
 import threading
 import time
 import logging
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Dict
+
+# Binary character record: char, pattern bits, servo A pulse, servo B pulse (µs)
+RecordCallback = Callable[[int, int, int, int], None]
 
 class SerialManager:
     """Manages serial communication with Arduino device."""
     
-    def __init__(self, message_callback: Callable[[str], None]):
+    # Upper bound on distinct received lines kept in the intern cache
+    INTERN_CACHE_SIZE = 256
+
+    # Separates character groups inside one TEXT command (ASCII record separator)
+    GROUP_SEPARATOR = "\x1e"
+
+    # Longest TEXT payload, in bytes, the firmware input buffer holds (1000 - "TEXT:" - newline/NUL)
+    MAX_TEXT_LENGTH = 993
+
+    # Characters the firmware can echo back one byte at a time (printable ASCII)
+    SENDABLE_CHARS = frozenset(chr(code) for code in range(32, 127))
+
+    # Stand-in for characters outside SENDABLE_CHARS
+    REPLACEMENT_CHAR = "?"
+
+    # Binary character records sent by the firmware in binary protocol mode
+    RECORD_START = b"\xa5"
+    RECORD_STRUCT = struct.Struct("<BBHH")
+
+    # Pre-encoded fixed protocol commands
+    _CONFIG_DUAL_ON = b"CONFIG:DUAL=1\n"
+    _CONFIG_DUAL_OFF = b"CONFIG:DUAL=0\n"
+    _CONFIG_BINARY_ON = b"CONFIG:BINARY=1\n"
+    _CONFIG_BINARY_OFF = b"CONFIG:BINARY=0\n"
+
+    # Pre-encoded TEXT commands for every printable ASCII character
+    _SINGLE_CHAR_COMMANDS = {chr(code): f"TEXT:{chr(code)}\n".encode() for code in range(32, 127)}
+
+    def __init__(self, message_callback: Callable[[str], None],
+                 record_callback: Optional[RecordCallback] = None,
+                 skip_duplicates: bool = False):
         """
         Initialize Serial Manager.
         
         Args:
-            message_callback: Callback function to handle received messages
+            message_callback: Callback function to handle received text lines
+            record_callback: Callback function to handle binary character records
+            skip_duplicates: Do not dispatch a line identical to the previous one
         """
         self.connection: Optional[serial.Serial] = None
         self.is_connected: bool = False
         self.message_callback = message_callback
+        self.record_callback = record_callback
+        self._debug_on = logging.getLogger().isEnabledFor(logging.DEBUG)
+        self.skip_duplicates = skip_duplicates
         self._read_thread: Optional[threading.Thread] = None
+        self._write_thread: Optional[threading.Thread] = None
+        self._write_queue: "queue.SimpleQueue[Optional[bytes]]" = queue.SimpleQueue()
         self._stop_thread: bool = False
+        self._write_error: Optional[Exception] = None
+        self._last_line: Optional[str] = None
+        self._intern_cache: Dict[bytes, str] = {}
 
     def get_available_ports(self) -> List[str]:
         """Get list of available serial ports."""
@@ -48,7 +94,7 @@ class SerialManager:
             self.connection = serial.Serial(
                 port=port,
                 baudrate=9600,
-                timeout=1,
+                timeout=0.2,  # readline() blocks at most this long, so stop requests are seen promptly
                 write_timeout=1
             )
             
@@ -57,10 +103,17 @@ class SerialManager:
             time.sleep(0.1)
             self.connection.dtr = True
             time.sleep(2)  # Allow Arduino initialization
+
+            # Discard boot output and stale bytes once; commands are
+            # newline-delimited so per-send resets are not needed
+            self.connection.reset_input_buffer()
+            self.connection.reset_output_buffer()
             
             self.is_connected = True
             self._stop_thread = False
+            self._write_error = None
             self._start_read_thread()
+            self._start_write_thread()
             logging.info(f"Connected to {port}")
         except Exception as e:
             logging.error(f"Failed to connect to {port}: {e}")
@@ -73,6 +126,11 @@ class SerialManager:
         
         if self._read_thread and self._read_thread.is_alive():
             self._read_thread.join(timeout=1)
+
+        # Let queued commands drain, then stop the writer
+        if self._write_thread and self._write_thread.is_alive():
+            self._write_queue.put(None)
+            self._write_thread.join(timeout=1)
             
         if self.connection and self.connection.is_open:
             self.connection.close()
@@ -80,7 +138,10 @@ class SerialManager:
 
     def send_text(self, text: str, char_delay: int, servo_delay: int) -> None:
         """
-        Send text command to Arduino.
+        Queue a text command for the Arduino.
+        
+        The command is written by the write thread, so write errors are
+        logged there instead of raised here.
         
         Args:
             text: Text to send
@@ -91,8 +152,7 @@ class SerialManager:
             ConnectionError: If not connected
             ValueError: If invalid parameters
         """
-        if not self.is_connected:
-            raise ConnectionError("Not connected to device")
+        self._check_connected()
 
         # Check if text is None or empty string after strip
         if text is None or text.strip() == "" and text != " ":
@@ -102,18 +162,105 @@ class SerialManager:
             # Prepare text command
             text_command = f"TEXT:{text}\n"
             
-            # Clear buffers
-            self.connection.reset_input_buffer()
-            self.connection.reset_output_buffer()
-            
-            # Send command
-            self.connection.write(text_command.encode())
-            self.connection.flush()
-            logging.debug(f"Text command sent: {text_command.strip()}")
+            # Queue command; the write thread sends it
+            self._write_queue.put(text_command.encode())
+            logging.debug(f"Text command queued: {text_command.strip()}")
         except Exception as e:
-            logging.error(f"Failed to send text: {e}")
+            logging.error(f"Failed to queue text: {e}")
             raise
 
+    def send_single_char(self, char: str, char_delay: int, servo_delay: int) -> None:
+        """
+        Queue a TEXT command for a single character.
+        
+        Uses a pre-encoded command for printable ASCII, so nothing is
+        formatted or encoded per call; other characters go through send_text.
+        
+        Args:
+            char: Character to send
+            char_delay: Character delay in milliseconds
+            servo_delay: Servo movement delay in milliseconds
+            
+        Raises:
+            ConnectionError: If not connected
+        """
+        self._check_connected()
+
+        command = self._SINGLE_CHAR_COMMANDS.get(char)
+        if command is None:
+            self.send_text(char, char_delay, servo_delay)
+            return
+
+        self._write_queue.put(command)
+        logging.debug(f"Single character command queued: {char!r}")
+
+    @classmethod
+    def sanitize_text(cls, text: str) -> str:
+        """
+        Replace characters the firmware cannot display.
+        
+        The firmware handles its input byte by byte, so anything outside
+        printable ASCII (multi-byte UTF-8, control characters, the group
+        separator) would come back as different characters or break the
+        command framing.
+        
+        Args:
+            text: Text to send
+            
+        Returns:
+            str: Text with every unsendable character replaced by REPLACEMENT_CHAR
+        """
+        sendable = cls.SENDABLE_CHARS
+        if sendable.issuperset(text):
+            return text
+        return "".join(c if c in sendable else cls.REPLACEMENT_CHAR for c in text)
+
+    def send_text_batch(self, groups: List[str], char_delay: int, servo_delay: int) -> int:
+        """
+        Send several character groups to Arduino in a single TEXT command.
+        
+        Groups are joined with GROUP_SEPARATOR and written in one call. Only
+        as many groups as fit in the firmware input buffer (measured in
+        encoded bytes) are sent; the caller sends the remainder once these
+        have been displayed. Groups must already be passed through
+        sanitize_text.
+        
+        Args:
+            groups: Character groups to send, in display order
+            char_delay: Character delay in milliseconds
+            servo_delay: Servo movement delay in milliseconds
+            
+        Returns:
+            int: Number of groups sent
+            
+        Raises:
+            ConnectionError: If not connected
+            ValueError: If a group is empty, contains characters the firmware
+                cannot display, or is longer than MAX_TEXT_LENGTH on its own
+        """
+        self._check_connected()
+
+        if not groups or any(not group for group in groups):
+            raise ValueError("Empty text")
+
+        # Take whole groups until the payload would overflow the firmware buffer
+        sendable = self.SENDABLE_CHARS
+        separator_len = len(self.GROUP_SEPARATOR.encode())
+        count = 0
+        length = -separator_len
+        for group in groups:
+            if not sendable.issuperset(group):
+                raise ValueError(f"Unsupported characters in text: {group!r}")
+            length += separator_len + len(group.encode())
+            if length > self.MAX_TEXT_LENGTH:
+                if not count:
+                    raise ValueError(f"Text group longer than {self.MAX_TEXT_LENGTH} bytes")
+                break
+            count += 1
+
+        self.send_text(self.GROUP_SEPARATOR.join(groups[:count]), char_delay, servo_delay)
+        return count
+
     def send_configuration(self, dual_servo_mode: bool) -> None:
         """
         Send configuration command to Arduino.
@@ -124,33 +271,134 @@ class SerialManager:
         Raises:
             ConnectionError: If not connected
         """
-        if not self.is_connected:
-            raise ConnectionError("Not connected to device")
+        self._check_connected()
+
+        try:
+            config_command = self._CONFIG_DUAL_ON if dual_servo_mode else self._CONFIG_DUAL_OFF
+            self._write_queue.put(config_command)
+            logging.debug(f"Configuration command queued: {config_command.strip().decode()}")
+        except Exception as e:
+            logging.error(f"Failed to queue configuration: {e}")
+            raise
+
+    def send_protocol(self, binary: bool) -> None:
+        """
+        Select how the Arduino reports displayed characters.
+        
+        Firmware without binary protocol support answers with an unknown
+        command message and keeps sending text lines, which are still handled.
+        
+        Args:
+            binary: Request binary character records instead of text lines
+            
+        Raises:
+            ConnectionError: If not connected
+        """
+        self._check_connected()
 
         try:
-            config_command = f"CONFIG:DUAL={int(dual_servo_mode)}\n"
-            self.connection.write(config_command.encode())
-            self.connection.flush()
-            logging.debug(f"Configuration command sent: {config_command.strip()}")
+            protocol_command = self._CONFIG_BINARY_ON if binary else self._CONFIG_BINARY_OFF
+            self._write_queue.put(protocol_command)
+            logging.debug(f"Protocol command queued: {protocol_command.strip().decode()}")
         except Exception as e:
-            logging.error(f"Failed to send configuration: {e}")
+            logging.error(f"Failed to queue protocol command: {e}")
             raise
 
+    def _check_connected(self) -> None:
+        """
+        Raise if commands can no longer reach the device.
+        
+        Raises:
+            ConnectionError: If not connected, including after the write
+                thread stopped on a fatal write error
+        """
+        if self.is_connected:
+            return
+        if self._write_error is not None:
+            raise ConnectionError(f"Serial write failed: {self._write_error}")
+        raise ConnectionError("Not connected to device")
+
     def _start_read_thread(self) -> None:
         """Start asynchronous read thread."""
         self._read_thread = threading.Thread(target=self._read_serial, daemon=True)
         self._read_thread.start()
 
+    def _start_write_thread(self) -> None:
+        """Start the thread that writes queued commands to the port."""
+        # Drop commands left over from a previous connection
+        while not self._write_queue.empty():
+            self._write_queue.get_nowait()
+        self._write_thread = threading.Thread(target=self._write_serial, daemon=True)
+        self._write_thread.start()
+
+    def _write_serial(self) -> None:
+        """Write queued commands in order until disconnect queues None."""
+        # Reused for every write; only this thread touches it
+        tx_buffer = bytearray()
+        stopping = False
+        while not stopping:
+            data = self._write_queue.get()
+            if data is None:
+                break
+            tx_buffer += data
+
+            # Coalesce commands queued meanwhile into the same write
+            while not self._write_queue.empty():
+                data = self._write_queue.get_nowait()
+                if data is None:
+                    stopping = True
+                    break
+                tx_buffer += data
+
+            try:
+                # Blocks at most write_timeout; callers on the Tk thread never wait
+                self.connection.write(tx_buffer)
+            except Exception as e:
+                # Includes write timeouts: part of the buffer may already be
+                # on the wire without its newline, which would corrupt the
+                # next command. Nothing will drain the queue any more, so
+                # stop reading too and report the error from the next send call.
+                logging.error(f"Serial write error: {e}")
+                self._write_error = e
+                self._stop_thread = True
+                self.is_connected = False
+                break
+            finally:
+                del tx_buffer[:]
+
     def _read_serial(self) -> None:
         """Continuous serial read loop."""
         while not self._stop_thread and self.is_connected and self.connection and self.connection.is_open:
             try:
-                if self.connection.in_waiting:
-                    line = self.connection.readline().decode().strip()
-                    if line:
-                        logging.debug(f"Received: {line}")
-                        self.message_callback(line)
-                time.sleep(0.1)  # Prevent CPU saturation
+                # Blocks until data arrives or the read timeout expires
+                first = self.connection.read(1)
+                if not first:
+                    continue
+
+                # Fixed-size binary record: no text parsing needed
+                if first == self.RECORD_START:
+                    record = self.connection.read(self.RECORD_STRUCT.size)
+                    if len(record) == self.RECORD_STRUCT.size and self.record_callback:
+                        self.record_callback(*self.RECORD_STRUCT.unpack(record))
+                    continue
+
+                raw = (first + self.connection.readline()).strip()
+                if not raw:
+                    continue
+
+                # Arduino output comes from a small vocabulary; reuse the decoded strings
+                line = self._intern_cache.get(raw)
+                if line is None:
+                    if len(self._intern_cache) >= self.INTERN_CACHE_SIZE:
+                        self._intern_cache.clear()
+                    line = self._intern_cache[raw] = sys.intern(raw.decode())
+
+                if self.skip_duplicates and line == self._last_line:
+                    continue
+                self._last_line = line
+                if self._debug_on:
+                    logging.debug("Received: %s", line)
+                self.message_callback(line)
             except serial.SerialException as e:
                 logging.error(f"Serial read error: {e}")
                 break
@@ -0,0 +1,3 @@
+"""
+Configuration management for the Braille Controller Application
+"""
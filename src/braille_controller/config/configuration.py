@@ -3,11 +3,40 @@ Configuration Management Module
 Handles loading, saving, and accessing application configuration settings
 """
 
+import os
 import json
+import atexit
 import logging
-from typing import Any, Dict
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Sentinel for keys absent from the configuration
+_MISSING = object()
+
+
+def _dumps(config: Dict[str, Any], pretty: bool) -> bytes:
+    """Serialize configuration to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(config, indent=2).encode()
+    return json.dumps(config, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes) -> Dict[str, Any]:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class Configuration:
     """Manages application configuration settings with file persistence."""
     
@@ -15,10 +44,17 @@ class Configuration:
         "char_delay": 3000,
         "servo_delay": 750,
         "dual_servo_mode": True,
+        "binary_protocol": True,
         "debug_mode": False,
         "theme": "default"
     }
 
+    # Expected value type for each configuration key
+    _SCHEMA = {key: type(value) for key, value in DEFAULT_CONFIG.items()}
+
+    # Delay before pending changes from set() are written to file (seconds)
+    SAVE_DELAY = 0.5
+
     def __init__(self, config_file: str = "braille_config.json"):
         """
         Initialize configuration manager.
@@ -28,15 +64,21 @@ class Configuration:
         """
         self.config_file = Path(config_file)
         self.config = self.DEFAULT_CONFIG.copy()
+        self._config_view = MappingProxyType(self.config)
+        self._dirty = False
+        self._last_serialized: Optional[bytes] = None
+        self._save_timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
         self.load_config()
+        atexit.register(self._save_pending)
         logging.debug("Configuration initialized")
 
     def load_config(self) -> None:
         """Load configuration from file, creating default if none exists."""
         try:
             if self.config_file.exists():
-                with open(self.config_file, "r") as f:
-                    loaded_config = json.load(f)
+                with open(self.config_file, "rb") as f:
+                    loaded_config = _loads(f.read())
                     self.config.update(loaded_config)
                     logging.debug("Configuration loaded from file")
             else:
@@ -47,15 +89,63 @@ class Configuration:
             logging.info("Using default configuration")
 
     def save_config(self) -> None:
-        """Save current configuration to file."""
+        """
+        Save current configuration to file.
+        
+        The file is written to a temporary sibling and renamed over the
+        original, so a crash mid-write never leaves a truncated file.
+        """
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(self.config, f, indent=4)
+            with self._lock:
+                # Compact output unless debugging, to keep rewrites small
+                serialized = _dumps(self.config, pretty=bool(self.config.get("debug_mode")))
+                if serialized == self._last_serialized and self.config_file.exists():
+                    self._dirty = False
+                    return
+
+                tmp_file = self.config_file.with_suffix(".json.tmp")
+                with open(tmp_file, "wb") as f:
+                    f.write(serialized)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.config_file)
+
+                self._last_serialized = serialized
+                self._dirty = False
                 logging.debug("Configuration saved to file")
         except Exception as e:
             logging.error(f"Failed to save configuration: {e}")
             raise
 
+    def flush(self) -> None:
+        """
+        Write pending changes from set() to file immediately.
+        
+        Raises:
+            Exception: If the configuration file cannot be written
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if self._dirty:
+                self.save_config()
+
+    def _save_pending(self) -> None:
+        """Flush pending changes from the save timer or at exit."""
+        try:
+            self.flush()
+        except Exception:
+            pass  # Already logged by save_config
+
+    def _schedule_save(self) -> None:
+        """(Re)start the timer that writes pending changes to file."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self.SAVE_DELAY, self._save_pending)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get configuration value by key.
@@ -71,32 +161,52 @@ class Configuration:
 
     def set(self, key: str, value: Any) -> None:
         """
-        Set configuration value and save to file.
+        Set configuration value and schedule a save to file.
+        
+        Changes are written after SAVE_DELAY seconds without further updates,
+        so bursts of set() calls result in a single write. Call flush() to
+        write immediately.
         
         Args:
             key (str): Configuration key
             value (Any): Value to set
         """
         if key in self.DEFAULT_CONFIG or key in self.config:
-            self.config[key] = value
-            self.save_config()
+            with self._lock:
+                self.config[key] = value
+                self._dirty = True
+                self._schedule_save()
             logging.debug(f"Configuration updated: {key} = {value}")
         else:
             logging.warning(f"Attempted to set unknown configuration key: {key}")
 
-    def get_all(self) -> Dict[str, Any]:
+    def get_all(self) -> Mapping[str, Any]:
         """
-        Get complete configuration dictionary.
+        Get a read-only view of the complete configuration.
+        
+        The view reflects later changes; use get_all_snapshot() for a copy.
         
         Returns:
-            Dict[str, Any]: Current configuration
+            Mapping[str, Any]: Current configuration
+        """
+        return self._config_view
+
+    def get_all_snapshot(self) -> Dict[str, Any]:
+        """
+        Get a mutable copy of the complete configuration dictionary.
+        
+        Returns:
+            Dict[str, Any]: Copy of the current configuration
         """
         return self.config.copy()
 
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
-        self.config = self.DEFAULT_CONFIG.copy()
-        self.save_config()
+        with self._lock:
+            # Update in place so views returned by get_all() stay current
+            self.config.clear()
+            self.config.update(self.DEFAULT_CONFIG)
+            self.save_config()
         logging.info("Configuration reset to defaults")
 
     def validate_config(self) -> bool:
@@ -106,15 +216,12 @@ class Configuration:
         Returns:
             bool: True if valid, False otherwise
         """
-        try:
-            for key, default_value in self.DEFAULT_CONFIG.items():
-                if key not in self.config:
-                    logging.warning(f"Missing configuration key: {key}")
-                    return False
-                if not isinstance(self.config[key], type(default_value)):
-                    logging.warning(f"Invalid type for configuration key: {key}")
-                    return False
-            return True
-        except Exception as e:
-            logging.error(f"Configuration validation error: {e}")
-            return False
\ No newline at end of file
+        for key, expected_type in self._SCHEMA.items():
+            value = self.config.get(key, _MISSING)
+            if value is _MISSING:
+                logging.warning(f"Missing configuration key: {key}")
+                return False
+            if not isinstance(value, expected_type):
+                logging.warning(f"Invalid type for configuration key: {key}")
+                return False
+        return True
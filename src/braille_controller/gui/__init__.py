@@ -0,0 +1,3 @@
+"""
+GUI components for the Braille Controller Application
+"""
@@ -8,17 +8,50 @@ from tkinter import ttk, messagebox, filedialog
 import logging
 import threading
 import re
-import sys
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))  # Add parent directory to path
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-# Import custom components
+# Import custom components (resolved from the application directory, see main.py)
 from config.configuration import Configuration
 from communication.serial_manager import SerialManager
 from visualization.braille_canvas import BraillePatternCanvas
 from visualization.servo_canvas import ServoVisualizer
 from visualization.braille_character_display import BrailleCharacterDisplay
 
+# Arduino message patterns, compiled once for the serial message hot path
+_CHAR_RE = re.compile(r'Character:\s*(\S?)\s*->\s*(.*)')
+_PATTERN_RE = re.compile(r'Pattern:\s*([01]{1,6})')
+_SERVO_RE = re.compile(r'Servo ([AB]) \((?:\d+)\): (\d+)µs')
+
+# Servo pulse range, adjusted based on observed values in logs
+MIN_PULSE = 500    # Slightly below minimum observed (844)
+MAX_PULSE = 2500   # Slightly above maximum observed (2037)
+MIN_ANGLE = 0
+MAX_ANGLE = 180
+_ANGLE_SPAN = MAX_ANGLE - MIN_ANGLE
+_PULSE_SPAN = MAX_PULSE - MIN_PULSE
+
+# Seconds a serial port enumeration is reused by the refresh button
+PORT_CACHE_TTL = 1.0
+
+# Smallest size JPEG uploads are decoded at before OCR (scale-on-decode)
+OCR_DRAFT_SIZE = (1600, 1600)
+
+
+@lru_cache(maxsize=2048)
+def _pulse_to_angle(pulse_width: int) -> float:
+    """Convert servo pulse width to angle using observed pulse range."""
+    # Ensure pulse width is within bounds
+    pulse_width = max(MIN_PULSE, min(pulse_width, MAX_PULSE))
+    
+    # Linear conversion
+    angle = round((pulse_width - MIN_PULSE) * _ANGLE_SPAN / _PULSE_SPAN, 1)
+    
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Converted %sµs to %s°", pulse_width, angle)
+    return angle
+
 
 class BrailleControllerGUI:
     """Main GUI class for the Braille Controller application."""
@@ -27,15 +60,29 @@ class BrailleControllerGUI:
         """Initialize the GUI application."""
         self.root = root
         self.root.title("Braille Controller Interface")
+
+        # Debug output is decided once; the level is set before the GUI starts
+        self._log = logging.getLogger(__name__)
+        self._debug_on = self._log.isEnabledFor(logging.DEBUG)
         
         # Initialize components
         self.config = Configuration()
-        self.serial_manager = SerialManager(self.process_serial_message)
+        self.serial_manager = SerialManager(
+            self.process_serial_message,
+            record_callback=self.process_serial_record
+        )
+        self._char_positions: Dict[str, List[int]] = {}  # Unprocessed display positions per character
+        self._remaining_chars = 0
+        # Parsed delays, refreshed from the entries by _reparse_delays
+        self._char_delay_i: int = self.config.get("char_delay")
+        self._servo_delay_i: int = self.config.get("servo_delay")
+        self._display_pool: List[BrailleCharacterDisplay] = []  # Hidden displays for reuse
+        self._port_cache: Optional[Tuple[float, List[str]]] = None  # (enumeration time, ports)
         
         # Set up GUI elements
         self._setup_gui()
         self._setup_bindings()
-        logging.debug("BrailleControllerGUI initialized")
+        self._log.debug("BrailleControllerGUI initialized")
 
     def _setup_gui(self):
         """Set up all GUI elements."""
@@ -130,12 +177,19 @@ class BrailleControllerGUI:
         # Character Delay
         ttk.Label(timing_frame, text="Character Delay (ms):").pack(anchor="w", padx=5, pady=(5, 0))
         self.char_delay_var = tk.StringVar(value=str(self.config.get("char_delay")))
-        ttk.Entry(timing_frame, textvariable=self.char_delay_var).pack(fill="x", padx=5, pady=2)
+        char_delay_entry = ttk.Entry(timing_frame, textvariable=self.char_delay_var)
+        char_delay_entry.pack(fill="x", padx=5, pady=2)
 
         # Servo Delay
         ttk.Label(timing_frame, text="Servo Movement Delay (ms):").pack(anchor="w", padx=5, pady=(5, 0))
         self.servo_delay_var = tk.StringVar(value=str(self.config.get("servo_delay")))
-        ttk.Entry(timing_frame, textvariable=self.servo_delay_var).pack(fill="x", padx=5, pady=2)
+        servo_delay_entry = ttk.Entry(timing_frame, textvariable=self.servo_delay_var)
+        servo_delay_entry.pack(fill="x", padx=5, pady=2)
+
+        # Keep the parsed delays current when an entry is committed
+        for entry in (char_delay_entry, servo_delay_entry):
+            entry.bind('<FocusOut>', self._reparse_delays)
+            entry.bind('<Return>', self._reparse_delays)
 
         # Servo Configuration
         servo_frame = ttk.LabelFrame(self.config_tab, text="Servo Configuration", padding="5")
@@ -174,13 +228,8 @@ class BrailleControllerGUI:
         self.scroll_frame = ttk.Frame(self.canvas)
         self.scroll_frame.pack(expand=True, fill="both", padx=20, pady=20)
         
-        def _on_frame_configure(event):
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-            # Ensure minimum width
-            if event.width < 800:
-                self.scroll_frame.configure(width=800)
-        
-        self.scroll_frame.bind("<Configure>", _on_frame_configure)
+        self._scrollregion_pending = False
+        self.scroll_frame.bind("<Configure>", self._on_frame_configure)
         
         # Create window in canvas
         self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="n", width=800)
@@ -193,19 +242,42 @@ class BrailleControllerGUI:
         self.char_displays = []
         self._update_character_displays()
 
+    def _on_frame_configure(self, event):
+        """Handle scroll frame resizes, coalescing scrollregion updates."""
+        # Ensure minimum width
+        if event.width < 800:
+            self.scroll_frame.configure(width=800)
+
+        # Adding or removing displays fires a burst of Configure events;
+        # recompute the bounding box once when the burst is over
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.root.after_idle(self._update_scrollregion)
+
+    def _update_scrollregion(self):
+        """Fit the canvas scrollregion to its contents."""
+        self._scrollregion_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     def _update_character_displays(self):
             """Update the number of character displays."""
             num_chars = self.char_count_var.get()
             
-            # Remove excess displays
+            # Hide excess displays and keep them for reuse
             while len(self.char_displays) > num_chars:
-                self.char_displays[-1].destroy()
-                self.char_displays.pop()
+                display = self.char_displays.pop()
+                display.pack_forget()
+                self._display_pool.append(display)
             
-            # Add new displays
+            # Add displays, reusing hidden ones first; the pool is LIFO so
+            # each reused display gets back its own character index
             while len(self.char_displays) < num_chars:
-                idx = len(self.char_displays) + 1
-                display = BrailleCharacterDisplay(self.scroll_frame, character_index=idx)
+                if self._display_pool:
+                    display = self._display_pool.pop()
+                    display.reset()
+                else:
+                    idx = len(self.char_displays) + 1
+                    display = BrailleCharacterDisplay(self.scroll_frame, character_index=idx)
                 display.pack(pady=5)
                 self.char_displays.append(display)
 
@@ -217,20 +289,28 @@ class BrailleControllerGUI:
 
     def _refresh_ports(self):
         """Refresh available serial ports."""
-        ports = self.serial_manager.get_available_ports()
+        ports = self._enumerate_ports_cached()
         self.port_combo['values'] = ports
         if ports:
             self.port_combo.set(ports[0])
-            logging.info(f"Available serial ports: {ports}")
+            self._log.info("Available serial ports: %s", ports)
         else:
             self.port_combo.set('')
-            logging.warning("No serial ports found")
+            self._log.warning("No serial ports found")
+
+    def _enumerate_ports_cached(self) -> List[str]:
+        """Return available serial ports, reusing an enumeration younger than PORT_CACHE_TTL."""
+        now = time.monotonic()
+        if self._port_cache is None or now - self._port_cache[0] >= PORT_CACHE_TTL:
+            self._port_cache = (now, self.serial_manager.get_available_ports())
+        return self._port_cache[1]
 
     def _toggle_connection(self):
         """Toggle serial connection state."""
         try:
             if not self.serial_manager.is_connected:
                 self.serial_manager.connect(self.port_var.get())
+                self.serial_manager.send_protocol(self.config.get("binary_protocol"))
                 self.connect_button.configure(text="Disconnect")
                 self.status_label.configure(text=f"Connected to {self.port_var.get()}")
             else:
@@ -240,7 +320,7 @@ class BrailleControllerGUI:
                 self.char_display.configure(text="Current Character: -")
                 self.progress['value'] = 0
         except Exception as e:
-            logging.error(f"Connection error: {e}")
+            self._log.error("Connection error: %s", e)
             messagebox.showerror("Connection Error", str(e))
 
     def _send_text(self):
@@ -250,12 +330,13 @@ class BrailleControllerGUI:
             if not text:
                 raise ValueError("Please enter some text to send")
 
-            char_delay = int(self.char_delay_var.get())
-            servo_delay = int(self.servo_delay_var.get())
+            self._reparse_delays()
+            char_delay = self._char_delay_i
+            servo_delay = self._servo_delay_i
             num_active_chars = self.char_count_var.get()
 
-            # Convert input text to lowercase before processing
-            text = text.lower()
+            # Convert input text to lowercase and drop what the firmware can't show
+            text = self.serial_manager.sanitize_text(text.lower())
             
             # Store the text and setup initial state
             self.current_text = text
@@ -272,24 +353,51 @@ class BrailleControllerGUI:
                 ]
             
             self.current_group_index = 0
-            self.processed_positions = set()  # Reset processed positions
+            self._index_group(self.current_text_groups[0])
             
-            # Send first group/character
+            # Send the groups in as few commands as possible; the firmware
+            # paces the characters and reports each one back
             if self.current_text_groups:
                 first_group = self.current_text_groups[0]
-                self.serial_manager.send_text(first_group, char_delay, servo_delay)
+                if len(text) == 1:
+                    # Interactive single keystroke: pre-encoded command
+                    self.serial_manager.send_single_char(text, char_delay, servo_delay)
+                    self._sent_group_count = 1
+                else:
+                    self._sent_group_count = self.serial_manager.send_text_batch(
+                        self.current_text_groups, char_delay, servo_delay)
                 self.progress['value'] = 0
                 self.char_display.configure(text=f"Current Character{'s' if len(first_group) > 1 else ''}: {', '.join(first_group)}")
 
             # Reset all character displays
             for display in self.char_displays:
-                display.update_letter("-")
-                display.pattern_canvas.update_pattern("000000")
+                display.reset()
 
         except Exception as e:
-            logging.error(f"Send error: {e}")
+            self._log.error("Send error: %s", e)
             messagebox.showerror("Send Error", str(e))
 
+    def _reparse_delays(self, event=None):
+        """
+        Parse the delay entries into the cached ints used while sending.
+        
+        Args:
+            event: Entry event when called from a binding
+            
+        Raises:
+            ValueError: If a delay is not an integer and no event was given
+        """
+        try:
+            char_delay = int(self.char_delay_var.get())
+            servo_delay = int(self.servo_delay_var.get())
+        except ValueError:
+            if event is None:
+                raise
+            self._log.warning("Invalid delay entered; keeping previous delays")
+            return
+        self._char_delay_i = char_delay
+        self._servo_delay_i = servo_delay
+
     def _save_configuration(self):
         """Save current configuration."""
         try:
@@ -297,9 +405,10 @@ class BrailleControllerGUI:
             self.config.set("servo_delay", int(self.servo_delay_var.get()))
             self.config.set("dual_servo_mode", self.dual_servo_var.get())
             self.config.set("debug_mode", self.debug_var.get())
+            self.config.flush()
             messagebox.showinfo("Success", "Configuration saved successfully")
         except Exception as e:
-            logging.error(f"Configuration save error: {e}")
+            self._log.error("Configuration save error: %s", e)
             messagebox.showerror("Save Error", str(e))
 
     def _on_dual_servo_toggle(self):
@@ -309,113 +418,154 @@ class BrailleControllerGUI:
             self.serial_manager.send_configuration(self.dual_servo_var.get())
 
     def process_serial_message(self, message: str):
-        """Process incoming serial messages and handle group transitions."""
-        logging.debug(f"Received message: {message}")
+        """Process incoming text serial messages and handle group transitions."""
+        if self._debug_on:
+            self._log.debug("Received message: %s", message)
         
         try:
-            if "Character:" in message:
-                parts = message.split("->")
-                if len(parts) == 2:
-                    # Parse character and pattern
-                    received_char = parts[0].split(":")[1].strip()
-                    char = received_char.lower()
-                    pattern_info = parts[1].strip()
-
-                    # Ensure text groups exist
-                    if hasattr(self, 'current_text_groups') and self.current_text_groups:
-                        current_group = self.current_text_groups[self.current_group_index]
-                        logging.debug(f"Processing group '{current_group}', character '{char}'")
-
-                        # Track processed positions for repeated characters
-                        if not hasattr(self, 'processed_positions'):
-                            self.processed_positions = set()
-
-                        # Handle spaces explicitly
-                        if char == '':
-                            char = ' '
-                            pattern_info = "Pattern: 000000"
-
-                        # Find the next unprocessed position for this character
-                        for idx, group_char in enumerate(current_group):
-                            if group_char == char and idx not in self.processed_positions:
-                                char_position = idx
-                                self.processed_positions.add(idx)
-                                break
-                        else:
-                            logging.error(f"Character '{char}' already processed or not found in group '{current_group}'")
-                            return
-
-                        # Handle pattern updates
-                        if "Pattern:" in pattern_info:
-                            binary_match = re.search(r'Pattern:\s*([01]{1,6})', pattern_info)
-                            if binary_match:
-                                raw_pattern = binary_match.group(1)
-                                pattern = raw_pattern.zfill(6)  # Pad to 6 bits
-                                logging.debug(f"Updating display {char_position} with pattern {pattern}")
-                                self.char_displays[char_position].pattern_canvas.update_pattern(pattern)
-                                self.char_displays[char_position].update_letter(received_char if char != ' ' else '-')
-                            else:
-                                logging.warning(f"No valid pattern found in message: {message}")
-                                self.char_displays[char_position].pattern_canvas.update_pattern("000000")
-                                self.char_displays[char_position].update_letter("-")
-
-                        # Update servo angles
-                        servo_matches = re.findall(r'Servo ([AB]) \((?:\d+)\): (\d+)µs', pattern_info)
-                        if servo_matches:
-                            pulses = {servo: int(pulse) for servo, pulse in servo_matches}
-                            angle_a = self._pulse_to_angle(pulses.get('A', 0))
-                            angle_b = self._pulse_to_angle(pulses.get('B', 0))
-                            logging.debug(f"Setting servo angles A: {angle_a}°, B: {angle_b}°")
-                            self.char_displays[char_position].update_servos(angle_a, angle_b)
-
-                        # Check if group is complete
-                        processed_count = len(self.processed_positions)
-                        if processed_count == len(current_group):
-                            logging.debug(f"Group '{current_group}' complete with {processed_count} characters processed.")
-                            self.current_group_index += 1
-                            self._move_to_next_group()
+            char_match = _CHAR_RE.search(message)
+            if char_match:
+                # Parse character and pattern
+                received_char, pattern_info = char_match.groups()
+
+                # Handle spaces explicitly
+                if received_char == '':
+                    self._handle_character(' ', "000000", None)
+                    return
+
+                pattern = None
+                if "Pattern:" in pattern_info:
+                    binary_match = _PATTERN_RE.search(pattern_info)
+                    if binary_match:
+                        pattern = binary_match.group(1).zfill(6)  # Pad to 6 bits
+                    else:
+                        self._log.warning("No valid pattern found in message: %s", message)
+                        pattern = ""
+
+                servo_matches = _SERVO_RE.findall(pattern_info)
+                pulses = {servo: int(pulse) for servo, pulse in servo_matches} if servo_matches else None
+
+                self._handle_character(received_char, pattern, pulses)
+
+        except Exception as e:
+            self._log.error("Message processing error: %s", e, exc_info=True)
+
+    def process_serial_record(self, char_code: int, pattern_bits: int, pulse_a: int, pulse_b: int):
+        """Process an incoming binary character record and handle group transitions."""
+        if self._debug_on:
+            self._log.debug("Received record: %d %s %d %d", char_code, format(pattern_bits, '06b'), pulse_a, pulse_b)
+
+        try:
+            received_char = chr(char_code)
+            # Pulse B is zero when the firmware runs in single servo mode
+            pulses = {'A': pulse_a, 'B': pulse_b} if pulse_b else {'A': pulse_a}
+            self._handle_character(received_char, format(pattern_bits, '06b'), pulses)
 
         except Exception as e:
-            logging.error(f"Message processing error: {e}", exc_info=True)
+            self._log.error("Record processing error: %s", e, exc_info=True)
+
+    def _handle_character(self, received_char: str, pattern: Optional[str],
+                          pulses: Optional[Dict[str, int]]):
+        """
+        Update the display for a character reported by the device.
+        
+        Args:
+            received_char: Character as reported by the device
+            pattern: Six-bit pattern string, empty if invalid, None if not reported
+            pulses: Servo pulse widths keyed by servo name, None if not reported
+        """
+        char = received_char.lower()
+
+        # Ensure text groups exist
+        if not (hasattr(self, 'current_text_groups') and self.current_text_groups):
+            return
+
+        current_group = self.current_text_groups[self.current_group_index]
+        if self._debug_on:
+            self._log.debug("Processing group '%s', character '%s'", current_group, char)
+
+        # Next unprocessed position for this character (handles repeats)
+        positions = self._char_positions.get(char)
+        if not positions:
+            self._log.error("Character '%s' already processed or not found in group '%s'", char, current_group)
+            return
+        char_position = positions.pop()
+        self._remaining_chars -= 1
+
+        display = self.char_displays[char_position]
+
+        # Handle pattern updates
+        letter = None
+        if pattern is not None:
+            if pattern:
+                if self._debug_on:
+                    self._log.debug("Updating display %d with pattern %s", char_position, pattern)
+                letter = received_char if char != ' ' else display.BLANK_LETTER
+            else:
+                display.reset()
+                pattern = None
+
+        # Update servo angles
+        angle_a = angle_b = None
+        if pulses:
+            angle_a = _pulse_to_angle(pulses.get('A', 0))
+            angle_b = _pulse_to_angle(pulses.get('B', 0))
+            if self._debug_on:
+                self._log.debug("Setting servo angles A: %s°, B: %s°", angle_a, angle_b)
+
+        # One coalesced redraw for pattern and servos
+        display.update_character(letter, pattern, angle_a, angle_b)
+
+        # Check if group is complete
+        if self._remaining_chars == 0:
+            processed_count = len(current_group)
+            if self._debug_on:
+                self._log.debug("Group '%s' complete with %d characters processed.", current_group, processed_count)
+            self.current_group_index += 1
+            self._move_to_next_group()
 
     def _move_to_next_group(self):
         """Move to the next group and reset displays."""
         if self.current_group_index < len(self.current_text_groups):
-            # Reset processed positions for the new group
-            self.processed_positions = set()
-
             next_group = self.current_text_groups[self.current_group_index]
-            char_delay = int(self.char_delay_var.get())
-            servo_delay = int(self.servo_delay_var.get())
-
-            logging.debug(f"Sending next group: '{next_group}'")
+            self._index_group(next_group)
+            if self._debug_on:
+                self._log.debug("Moving to next group: '%s'", next_group)
             self.char_display.configure(text=f"Current Characters: {', '.join(next_group)}")
 
-            # Schedule next group send
-            self.root.after(char_delay, lambda: self.serial_manager.send_text(
-                next_group, char_delay, servo_delay))
+            # Schedule the next batch once everything already sent is displayed
+            if self.current_group_index == self._sent_group_count:
+                char_delay = self._char_delay_i
+                servo_delay = self._servo_delay_i
+                self.root.after(char_delay, self._send_remaining_groups, char_delay, servo_delay)
         else:
-            logging.debug("All groups processed")
+            self._log.debug("All groups processed")
 
-
-    def _pulse_to_angle(self, pulse_width: int) -> float:
-        """Convert servo pulse width to angle using observed pulse range."""
-        # Adjusted based on observed values in logs
-        MIN_PULSE = 500    # Slightly below minimum observed (844)
-        MAX_PULSE = 2500   # Slightly above maximum observed (2037)
-        MIN_ANGLE = 0
-        MAX_ANGLE = 180
-        
-        # Ensure pulse width is within bounds
-        pulse_width = max(MIN_PULSE, min(pulse_width, MAX_PULSE))
-        logging.debug(f"Pulse width (bounded): {pulse_width}µs")
+    def _index_group(self, group: str):
+        """
+        Map each character of a group to its unprocessed display positions.
         
-        # Linear conversion
-        angle = (pulse_width - MIN_PULSE) * (MAX_ANGLE - MIN_ANGLE) / (MAX_PULSE - MIN_PULSE)
-        angle = round(angle, 1)
+        Positions are stored in descending order so pop() yields the leftmost
+        remaining occurrence of a repeated character.
         
-        logging.debug(f"Converted {pulse_width}µs to {angle}°")
-        return angle
+        Args:
+            group: Characters currently shown on the displays
+        """
+        positions: Dict[str, List[int]] = {}
+        for idx in range(len(group) - 1, -1, -1):
+            positions.setdefault(group[idx], []).append(idx)
+        self._char_positions = positions
+        self._remaining_chars = len(group)
+
+    def _send_remaining_groups(self, char_delay: int, servo_delay: int):
+        """Send the groups that did not fit in the previous batch."""
+        try:
+            remaining_groups = self.current_text_groups[self._sent_group_count:]
+            self._sent_group_count += self.serial_manager.send_text_batch(
+                remaining_groups, char_delay, servo_delay)
+        except Exception as e:
+            self._log.error("Send error: %s", e)
+            messagebox.showerror("Send Error", str(e))
 
     def _on_closing(self):
         """Handle application closure."""
@@ -423,12 +573,8 @@ class BrailleControllerGUI:
         self.root.destroy()
 
     def _upload_image(self):
-
-        """Handle image upload and OCR processing."""
+        """Select an image and start OCR processing in a worker thread."""
         try:
-            # Import easyocr here to avoid startup delay
-            import easyocr
-            
             # Open file dialog to select image
             image_path = filedialog.askopenfilename(
                 title="Select Image",
@@ -443,40 +589,63 @@ class BrailleControllerGUI:
                 
             # Disable the upload button to prevent multiple clicks
             self.upload_button.config(state='disabled')
-            
-            try:
-                # Initialize reader
-                reader = easyocr.Reader(['en'])
-                
-                # Process image
-                result = reader.readtext(image_path)
-                
-                # Extract text with confidence threshold
-                extracted_text = []
-                for bbox, text, prob in result:
-                    if prob > 0.5:  # Confidence threshold
-                        extracted_text.append(text)
-                        
-                if extracted_text:
-                    final_text = ' '.join(extracted_text)
-                    self.text_input.delete(0, tk.END)
-                    self.text_input.insert(0, final_text)
-                    messagebox.showinfo("Success", "Text extracted from image")
-                else:
-                    messagebox.showwarning("No Text Found", 
-                        "No text could be extracted from the image with sufficient confidence")
-                        
-            except ImportError as e:
-                logging.error(f"Failed to import easyocr module: {e}")
-                messagebox.showerror("Error", 
-                    "OCR module not available. Please ensure EasyOCR is properly installed.")
-            except Exception as e:
-                logging.error(f"OCR processing error: {e}")
-                messagebox.showerror("Error", f"Failed to process image: {str(e)}")
+            threading.Thread(target=self._run_ocr, args=(image_path,), daemon=True).start()
                     
         except Exception as e:
-            logging.error(f"Image upload error: {e}")
+            self._log.error("Image upload error: %s", e)
             messagebox.showerror("Upload Error", str(e))
-        finally:
-            # Re-enable the upload button
-            self.upload_button.config(state='normal')
\ No newline at end of file
+            self.upload_button.config(state='normal')
+
+    def _run_ocr(self, image_path: str):
+        """Run OCR off the Tk thread and hand the result back to it."""
+        try:
+            # Import the OCR module here to avoid startup delay
+            import brailleOCR
+            import numpy as np
+            from PIL import Image
+
+            # Process-wide reader, normally already loaded by the launch-time warm-up
+            ocr_reader = brailleOCR.get_reader()
+            
+            # Decode once; JPEGs are downscaled by the decoder itself
+            with Image.open(image_path) as image:
+                image.draft('RGB', OCR_DRAFT_SIZE)
+                image_array = np.asarray(image.convert('RGB'))
+
+            # Process image, recognizing detected boxes in batches
+            result = ocr_reader.readtext(
+                image_array,
+                detail=1,
+                paragraph=False,
+                batch_size=brailleOCR.RECOGNIZER_BATCH_SIZE,
+                workers=0
+            )
+            
+            # Extract text with confidence threshold
+            final_text = ' '.join(text for _, text, prob in result if prob > 0.5)
+
+            self.root.after(0, self._ocr_done, final_text)
+                    
+        except ImportError as e:
+            self._log.error("Failed to import OCR module: %s", e)
+            self.root.after(0, self._ocr_failed,
+                "OCR module not available. Please ensure EasyOCR is properly installed.")
+        except Exception as e:
+            self._log.error("OCR processing error: %s", e)
+            self.root.after(0, self._ocr_failed, f"Failed to process image: {str(e)}")
+
+    def _ocr_done(self, final_text: str):
+        """Show OCR results on the Tk thread."""
+        self.upload_button.config(state='normal')
+        if final_text:
+            self.text_input.delete(0, tk.END)
+            self.text_input.insert(0, final_text)
+            messagebox.showinfo("Success", "Text extracted from image")
+        else:
+            messagebox.showwarning("No Text Found", 
+                "No text could be extracted from the image with sufficient confidence")
+
+    def _ocr_failed(self, error_message: str):
+        """Report an OCR failure on the Tk thread."""
+        self.upload_button.config(state='normal')
+        messagebox.showerror("Error", error_message)
@@ -3,16 +3,39 @@ Braille Controller Application
 Main entry point that initializes and runs the application
 """
 import tkinter as tk
+from tkinter import ttk
 import sys
+import os
 import logging
+import logging.handlers
+import queue
+import threading
 from pathlib import Path
 from datetime import datetime
 
 # Import the main GUI class
 from gui.controller_gui import BrailleControllerGUI
 
+# Log file rotation and write batching
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+LOG_BUFFER_RECORDS = 128
+
+# Background thread writing queued log records to the file and console
+_log_listener: logging.handlers.QueueListener = None
+# Buffers file records; flushed when full, on WARNING and above, and at shutdown
+_log_buffer: logging.handlers.MemoryHandler = None
+
 def setup_logging():
-    """Configure logging with file and console output."""
+    """Configure logging with file and console output.
+
+    The level defaults to INFO and can be overridden with the BRAILLE_LOG
+    environment variable (e.g. BRAILLE_LOG=DEBUG). Records are handed to a
+    queue so callers such as the serial read thread never block on disk I/O,
+    and file writes are batched and rotated.
+    """
+    global _log_listener, _log_buffer
+
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -21,18 +44,44 @@ def setup_logging():
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"braille_controller_{timestamp}.log"
 
+    level_name = os.environ.get("BRAILLE_LOG", "INFO").upper()
+    level = logging.getLevelName(level_name)
+    if not isinstance(level, int):
+        level = logging.INFO
+
+    formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT
+    )
+    console_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+    _log_buffer = logging.handlers.MemoryHandler(
+        LOG_BUFFER_RECORDS, flushLevel=logging.WARNING, target=file_handler
+    )
+
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, _log_buffer, console_handler)
+    _log_listener.start()
+
     # Configure logging
     logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s [%(levelname)s] %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
+        level=level,
+        format='%(message)s',  # Final formatting happens in the listener handlers
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
+    if level_name != logging.getLevelName(level):
+        logging.warning(f"Unknown BRAILLE_LOG level '{level_name}', using {logging.getLevelName(level)}")
     logging.info("Logging initialized")
     return log_file
 
+def shutdown_logging():
+    """Flush queued and buffered log records and stop the logging thread."""
+    if _log_listener is not None:
+        _log_listener.stop()
+    if _log_buffer is not None:
+        _log_buffer.flush()
+
 def setup_exception_handling(root: tk.Tk):
     """Configure global exception handler for unhandled exceptions."""
     def handle_exception(exc_type, exc_value, exc_traceback):
@@ -89,14 +138,32 @@ def setup_window_style(root: tk.Tk):
     root.configure(bg='#2E2E2E')  # Dark background
     
     # Configure default styles
-    style = tk.ttk.Style()
+    style = ttk.Style(root)
     style.configure('TFrame', background='#2E2E2E')
+    style.configure('Dark.TFrame', background='#2E2E2E')  # Character display frames
     style.configure('TLabel', background='#2E2E2E', foreground='white')
     style.configure('TButton', padding=5)
     
     # Configure window behavior
     root.protocol("WM_DELETE_WINDOW", root.quit)  # Proper cleanup on close
 
+def start_ocr_warm_up():
+    """Load the OCR reader in the background so the first image upload is fast.
+
+    brailleOCR is imported on the worker thread too, keeping its OpenCV and
+    NumPy imports off the Tk startup path. The GUI's OCR path uses the same
+    module-level reader once it is loaded.
+    """
+    def _warm_up():
+        try:
+            import brailleOCR
+        except ImportError as e:
+            logging.warning(f"OCR warm-up skipped, OCR module not available: {e}")
+            return
+        brailleOCR.warm_up()
+
+    threading.Thread(target=_warm_up, name="ocr-warm-up", daemon=True).start()
+
 def main():
     """Initialize and run the application."""
     try:
@@ -131,6 +198,9 @@ def main():
         app = BrailleControllerGUI(root)
         logging.info("GUI initialized successfully")
 
+        # Load the OCR models while the user connects and types
+        start_ocr_warm_up()
+
         # Log application start
         logging.info(f"Application started - Log file: {log_file}")
 
@@ -142,6 +212,7 @@ def main():
         sys.exit(1)
     finally:
         logging.info("Application shutdown complete")
+        shutdown_logging()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,3 @@
+"""
+Braille pattern and servo visualization widgets
+"""
@@ -3,10 +3,19 @@ Braille Pattern Visualization Component
 """
 import tkinter as tk
 import logging
+from .deferred_draw import defer_while_hidden
 
 class BraillePatternCanvas(tk.Canvas):
     """Visualizes Braille dot patterns in a 3x2 grid."""
     
+    BLANK = "000000"  # Pattern with no raised dots
+
+    # Bit of the 6-bit pattern holding each dot, by [column][row]
+    _SHIFT = ((5, 3, 1), (4, 2, 0))
+
+    # Per-dot canvas tags, indexed by pattern bit
+    _BIT_TAGS = tuple(f"bit{b}" for b in range(6))
+
     def __init__(self, parent, character_index=1, **kwargs):
         super().__init__(parent, **kwargs)
         self.dot_radius = 10
@@ -17,15 +26,30 @@ class BraillePatternCanvas(tk.Canvas):
         self.width = self.dot_spacing * 3 + 40
         self.height = self.dot_spacing * 4
         self.configure(width=self.width, height=self.height)
-        
-        # Initialize dots state (2x3 grid for standard braille)
-        self.dots_state = [[False] * 3 for _ in range(2)]
-        self.draw_pattern()
 
-    def draw_pattern(self):
-        """Draws the current Braille dot pattern."""
-        self.delete("all")
+        # Dot bounding boxes, column by column; the canvas size is fixed
+        self._dot_bboxes = self._compute_dot_bboxes()
         
+        # Dots state as a 6-bit pattern (bit 5 = dot 1 ... bit 0 = dot 6)
+        self._state_bits = 0
+        self._drawn_bits = 0  # State the canvas items currently show
+        self._last_pattern = self.BLANK  # Pattern string last applied
+
+        # Dots are created once; redraws only recolor the ones that changed
+        self._dot_ids = [[None] * 3 for _ in range(2)]
+        self._build_pattern()
+
+    @property
+    def dots_state(self):
+        """Dot states as (left column, right column) tuples of 0/1, top to bottom."""
+        return tuple(tuple(self.dot(i, j) for j in range(3)) for i in range(2))
+
+    def dot(self, i: int, j: int) -> int:
+        """Return 1 if the dot in column i, row j is raised, else 0."""
+        return (self._state_bits >> self._SHIFT[i][j]) & 1
+
+    def _compute_dot_bboxes(self):
+        """Compute the (x0, y0, x1, y1) box of each dot, column by column."""
         # Calculate center positions
         center_x = self.width / 2
         center_y = self.height / 2
@@ -36,30 +60,83 @@ class BraillePatternCanvas(tk.Canvas):
         start_x = center_x - (pattern_width / 2) + self.dot_spacing/2
         start_y = center_y - (pattern_height / 2) + self.dot_spacing/2
         
-        # Draw dots in upright orientation
+        # Dots in upright orientation
+        bboxes = []
         for i in range(2):  # columns
             for j in range(3):  # rows
                 x = start_x + (i * self.dot_spacing)
                 y = start_y + (j * self.dot_spacing)
-                color = "black" if self.dots_state[i][j] else "white"
-                self.create_oval(
+                bboxes.append((
                     x - self.dot_radius,
                     y - self.dot_radius,
                     x + self.dot_radius,
-                    y + self.dot_radius,
-                    fill=color,
-                    outline="gray"
-                )
+                    y + self.dot_radius
+                ))
+        return tuple(bboxes)
 
-    def update_pattern(self, pattern: str):
-        """Update pattern using 6-bit binary string."""
+    def _build_pattern(self):
+        """Create the six dot items in their initial state."""
+        self.delete("all")
+        
+        for k, bbox in enumerate(self._dot_bboxes):
+            i, j = divmod(k, 3)
+            color = "black" if self.dot(i, j) else "white"
+            self._dot_ids[i][j] = self.create_oval(
+                *bbox, fill=color, outline="gray", tags=("dot", self._BIT_TAGS[self._SHIFT[i][j]])
+            )
+        self._drawn_bits = self._state_bits
+
+    def draw_pattern(self):
+        """Draws the current Braille dot pattern, recoloring only changed dots."""
+        # Hidden displays keep their state and catch up once shown
+        if defer_while_hidden(self, self.draw_pattern):
+            return
+        state = self._state_bits
+        changed = state ^ self._drawn_bits
+        if not changed:
+            return
+
+        # At most two configure calls: one for raised dots, one for lowered
+        if not state:
+            self.itemconfigure("dot", fill="white")
+        else:
+            raised = []
+            lowered = []
+            while changed:
+                low_bit = changed & -changed
+                tag = self._BIT_TAGS[low_bit.bit_length() - 1]
+                (raised if state & low_bit else lowered).append(tag)
+                changed ^= low_bit
+            if raised:
+                self.itemconfigure("||".join(raised), fill="black")
+            if lowered:
+                self.itemconfigure("||".join(lowered), fill="white")
+        self._drawn_bits = state
+
+    def update_pattern(self, pattern: str, redraw: bool = True):
+        """Update pattern using 6-bit binary string.
+
+        With redraw=False only the dot state changes; the caller draws later
+        with draw_pattern(), which recolors whatever changed in between.
+        """
+        # A held character re-sends the identical string; skip even the parse
+        if pattern == self._last_pattern:
+            return
         try:
-            bits = [bool(int(b)) for b in pattern.zfill(6)]
-            self.dots_state = [
-                [bits[0], bits[2], bits[4]],  # Left column (1,2,3)
-                [bits[1], bits[3], bits[5]]   # Right column (4,5,6)
-            ]
+            v = int(pattern, 2) if pattern else 0
+        except (TypeError, ValueError) as e:
+            logging.error("Error updating Braille pattern: %s", e)
+            return
+        if not 0 <= v <= 0b111111:
+            logging.error("Error updating Braille pattern: pattern out of range: %s", pattern)
+            return
+
+        # Same dots written differently (e.g. without leading zeros)
+        if v == self._state_bits:
+            self._last_pattern = pattern
+            return
+        self._state_bits = v
+        if redraw:
             self.draw_pattern()
-            logging.debug(f"Pattern updated: {pattern}")
-        except Exception as e:
-            logging.error(f"Error updating Braille pattern: {e}")
\ No newline at end of file
+        self._last_pattern = pattern
+        logging.debug("Pattern updated: %s", pattern)
\ No newline at end of file
@@ -2,32 +2,39 @@
 Combined Braille Character Display Component
 """
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk
+from typing import Optional
 from .braille_canvas import BraillePatternCanvas
 from .servo_canvas import ServoVisualizer
 
 class BrailleCharacterDisplay(ttk.Frame):
+    BLANK_LETTER = "-"  # Shown when no character is displayed
+
+    # Fonts shared by all instances, created with the first one
+    _header_font: tkfont.Font = None
+    _letter_font: tkfont.Font = None
+
     def __init__(self, parent, character_index=1, **kwargs):
         super().__init__(parent, **kwargs)
         self.character_index = character_index
-        self.current_letter = "-"
-        
-        # Create main bounding box frame with dark background
-        self.main_frame = ttk.Frame(self, style='Dark.TFrame')
-        self.main_frame.pack(fill="x", expand=True, padx=20, pady=10)  # Increased padding
-        
-        # Create container with fixed minimum size
-        self.content_frame = ttk.Frame(self.main_frame, style='Dark.TFrame')
-        self.content_frame.pack(fill="x", expand=True)
+        self.current_letter = self.BLANK_LETTER
+        if BrailleCharacterDisplay._header_font is None:
+            BrailleCharacterDisplay._header_font = tkfont.Font(family="Arial", size=12, weight="bold")
+            BrailleCharacterDisplay._letter_font = tkfont.Font(family="Arial", size=24, weight="bold")
+        self._flush_pending = False  # A coalesced canvas redraw is scheduled
         
-        # Force minimum width
+        # Single bounding box frame with dark background holding all content
+        # (Dark.TFrame is configured once with the application styles)
+        self.content_frame = ttk.Frame(self, style='Dark.TFrame')
+        self.content_frame.pack(fill="x", expand=True, padx=20, pady=10)  # Increased padding
         self.content_frame.grid_columnconfigure(0, minsize=600)  # Set minimum width
         
         # Header with more padding
         self.header = ttk.Label(
             self.content_frame, 
             text=f"Braille Character {character_index}",
-            font=("Arial", 12, "bold"),
+            font=self._header_font,
             background='dark gray',
             foreground='white'
         )
@@ -37,7 +44,7 @@ class BrailleCharacterDisplay(ttk.Frame):
         self.letter_display = ttk.Label(
             self.content_frame,
             text=self.current_letter,
-            font=("Arial", 24, "bold"),
+            font=self._letter_font,
             background='dark gray',
             foreground='white'
         )
@@ -63,15 +70,49 @@ class BrailleCharacterDisplay(ttk.Frame):
         
     def update_letter(self, letter: str):
         """Update the displayed letter."""
+        if letter == self.current_letter:
+            return
         self.current_letter = letter
         self.letter_display.configure(text=letter)
         
+    def reset(self):
+        """Clear the letter and pattern; already blank displays are left untouched."""
+        self.update_letter(self.BLANK_LETTER)
+        self.pattern_canvas.update_pattern(BraillePatternCanvas.BLANK)
+        
     def update_servos(self, angle_a: float, angle_b: float):
         """Delegate servo update to servo canvas."""
         self.servo_canvas.set_angle(angle_a, angle_b)
         
-    def update_idletasks(self):
-        """Force immediate update of the display."""
-        super().update_idletasks()
-        self.pattern_canvas.update_idletasks()
-        self.servo_canvas.update_idletasks()
\ No newline at end of file
+    def update_character(self, letter: Optional[str], pattern: Optional[str],
+                         angle_a: Optional[float] = None, angle_b: Optional[float] = None):
+        """
+        Update letter, pattern and servos together with one deferred redraw.
+        
+        Args:
+            letter: Letter to show, None to keep the current one
+            pattern: 6-bit binary pattern string, None to keep the current one
+            angle_a: Servo A angle, None to keep both servo angles
+            angle_b: Servo B angle
+        """
+        if letter is not None:
+            self.update_letter(letter)
+        if pattern is not None:
+            self.pattern_canvas.update_pattern(pattern, redraw=False)
+        if angle_a is not None:
+            self.servo_canvas.set_angle(angle_a, angle_b, redraw=False)
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.after_idle(self._flush)
+
+    def _flush(self):
+        """Draw both canvases once for all updates since the last flush."""
+        self._flush_pending = False
+        self.pattern_canvas.draw_pattern()
+        self.servo_canvas.draw_servos()
+
+    def force_redraw(self):
+        """Draw pending changes and put them on screen now (one idle pass)."""
+        if self._flush_pending:
+            self._flush()
+        self.update_idletasks()
\ No newline at end of file
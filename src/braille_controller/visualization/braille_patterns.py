@@ -1,25 +1,39 @@
 """
 Braille pattern definitions matching Arduino implementation
 """
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+__all__ = [
+    "BRAILLE_PATTERNS", "BRAILLE_NUMBERS", "BRAILLE_SPECIAL",
+    "BRAILLE_PATTERNS_INT", "BRAILLE_NUMBERS_INT", "BRAILLE_SPECIAL_INT",
+    "PATTERN_TO_ANGLE",
+    "get_pattern_for_char", "get_pattern_int_for_char", "pattern_to_angles",
+    "patterns_for_text", "validate_pattern",
+]
 
 # Braille patterns for lowercase letters a-z
-BRAILLE_PATTERNS = {
+BRAILLE_PATTERNS = MappingProxyType({
     'a': "100000", 'b': "101000", 'c': "110000", 'd': "110100", 'e': "100100",
     'f': "111000", 'g': "111100", 'h': "101100", 'i': "011000", 'j': "011100",
     'k': "100010", 'l': "101010", 'm': "110010", 'n': "110110", 'o': "100110",
     'p': "111010", 'q': "111110", 'r': "101110", 's': "011010", 't': "011110",
     'u': "100011", 'v': "101011", 'w': "011101", 'x': "110011", 'y': "110111",
     'z': "100111"
-}
+})
 
 # Braille patterns for numbers 0-9
-BRAILLE_NUMBERS = {
+BRAILLE_NUMBERS = MappingProxyType({
     '0': "010110", '1': "100000", '2': "101000", '3': "110000", '4': "110100",
     '5': "100100", '6': "111000", '7': "111100", '8': "101100", '9': "011000"
-}
+})
 
 # Other Braille patterns
-BRAILLE_SPECIAL = {
+BRAILLE_SPECIAL = MappingProxyType({
     ' ': "000000",  # space
     '.': "010011",  # period
     ',': "010000",  # comma
@@ -39,10 +53,22 @@ BRAILLE_SPECIAL = {
     '=': "001111",  # equals
     '_': "001101",  # underscore
     '"': "001010"   # quotation mark
-}
+})
+
+# Integer forms of the tables above (bit 5 = dot 1 ... bit 0 = dot 6), built once
+BRAILLE_PATTERNS_INT = MappingProxyType({k: int(v, 2) for k, v in BRAILLE_PATTERNS.items()})
+BRAILLE_NUMBERS_INT = MappingProxyType({k: int(v, 2) for k, v in BRAILLE_NUMBERS.items()})
+BRAILLE_SPECIAL_INT = MappingProxyType({k: int(v, 2) for k, v in BRAILLE_SPECIAL.items()})
+
+# All tables merged for single lookups; letters win over numbers over specials,
+# matching the order the tables were previously checked in
+_ALL_PATTERNS = MappingProxyType({**BRAILLE_SPECIAL, **BRAILLE_NUMBERS, **BRAILLE_PATTERNS})
+_ALL_PATTERNS_INT = MappingProxyType({**BRAILLE_SPECIAL_INT, **BRAILLE_NUMBERS_INT, **BRAILLE_PATTERNS_INT})
+_SPACE_PATTERN = BRAILLE_SPECIAL[' ']
+_SPACE_PATTERN_INT = BRAILLE_SPECIAL_INT[' ']
 
 # Pattern to angle mapping (matches Arduino PATTERN_TO_ANGLE array)
-PATTERN_TO_ANGLE = [
+PATTERN_TO_ANGLE = (
     66,  # 000
     84,  # 001
     37,  # 010
@@ -51,36 +77,71 @@ PATTERN_TO_ANGLE = [
     26,  # 101
     22,  # 110
     0    # 111
-]
+)
+
+# Servo angles for every 6-bit pattern: servo A takes the top 3 bits (b5b4b3),
+# servo B the bottom 3 bits (b2b1b0)
+_PATTERN_ANGLES = tuple(
+    (PATTERN_TO_ANGLE[(v >> 3) & 0x07], PATTERN_TO_ANGLE[v & 0x07]) for v in range(64)
+)
+
+@lru_cache(maxsize=None)
+def _bulk_tables():
+    """
+    Build the NumPy lookup tables for patterns_for_text on first use, so
+    the rest of this module does not depend on NumPy.
+    
+    Returns:
+        tuple: (numpy module, Latin-1 code point -> pattern,
+        pattern -> servo A angle, pattern -> servo B angle)
+    """
+    import numpy as np
+
+    char_to_pat = np.full(256, _SPACE_PATTERN_INT, dtype=np.uint8)
+    for char, pattern in _ALL_PATTERNS_INT.items():
+        char_to_pat[ord(char)] = pattern
+        char_to_pat[ord(char.upper())] = pattern
+    pat_to_a = np.array([angles[0] for angles in _PATTERN_ANGLES], dtype=np.uint8)
+    pat_to_b = np.array([angles[1] for angles in _PATTERN_ANGLES], dtype=np.uint8)
+    return np, char_to_pat, pat_to_a, pat_to_b
+
+# Every well-formed 6-bit pattern string
+_VALID_PATTERNS = frozenset(format(v, '06b') for v in range(64))
 
 def get_pattern_for_char(char: str) -> str:
     """Get the Braille pattern for a given character."""
-    char = char.lower()
-    if char in BRAILLE_PATTERNS:
-        return BRAILLE_PATTERNS[char]
-    elif char in BRAILLE_NUMBERS:
-        return BRAILLE_NUMBERS[char]
-    elif char in BRAILLE_SPECIAL:
-        return BRAILLE_SPECIAL[char]
-    return BRAILLE_SPECIAL[' ']  # Default to space pattern
-
-def pattern_to_angles(pattern: str) -> tuple[int, int]:
-    """Convert a 6-bit pattern string to servo angles."""
-    # Convert pattern string to integer
-    pattern_int = int(pattern, 2)
-    
-    # Split into two 3-bit patterns
-    servo_a_bits = (pattern_int >> 3) & 0x07  # Top 3 bits (b5b4b3)
-    servo_b_bits = pattern_int & 0x07         # Bottom 3 bits (b2b1b0)
+    return _ALL_PATTERNS.get(char.lower(), _SPACE_PATTERN)  # Default to space pattern
+
+def get_pattern_int_for_char(char: str) -> int:
+    """Get the Braille pattern for a given character as a 6-bit integer."""
+    return _ALL_PATTERNS_INT.get(char.lower(), _SPACE_PATTERN_INT)  # Default to space pattern
+
+def pattern_to_angles(pattern: Union[str, int]) -> tuple[int, int]:
+    """Convert a 6-bit pattern (binary string or integer) to servo angles."""
+    value = pattern if isinstance(pattern, int) else int(pattern, 2)
+    # Keep only the six pattern bits, as the servos only see b5..b0
+    return _PATTERN_ANGLES[value & 0x3F]
+
+def patterns_for_text(text: str) -> "np.ndarray":
+    """
+    Look up patterns and servo angles for a whole string at once.
     
-    # Get angles from lookup table
-    angle_a = PATTERN_TO_ANGLE[servo_a_bits]
-    angle_b = PATTERN_TO_ANGLE[servo_b_bits]
+    Characters without a pattern, including any outside Latin-1, map to the
+    space pattern, as in get_pattern_int_for_char. Requires NumPy, which is
+    imported on the first call.
     
-    return angle_a, angle_b
+    Args:
+        text: Text to convert
+        
+    Returns:
+        np.ndarray: (N, 3) uint8 array of (pattern, angle_a, angle_b) rows
+    """
+    np, char_to_pat, pat_to_a, pat_to_b = _bulk_tables()
+    codes = np.frombuffer(text.lower().encode('utf-32-le'), dtype='<u4')
+    codes = np.where(codes < 256, codes, ord(' '))
+    pats = char_to_pat[codes]
+    return np.stack([pats, pat_to_a[pats], pat_to_b[pats]], axis=1)
 
 def validate_pattern(pattern: str) -> bool:
     """Validate that a pattern string is correct format."""
-    if not pattern or len(pattern) != 6:
-        return False
-    return all(bit in '01' for bit in pattern)
\ No newline at end of file
+    return pattern in _VALID_PATTERNS
\ No newline at end of file
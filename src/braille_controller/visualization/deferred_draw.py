@@ -0,0 +1,58 @@
+"""
+Deferred drawing for hidden visualization widgets
+"""
+import tkinter as tk
+import weakref
+from typing import Callable
+
+# Widgets whose redraw was skipped while hidden, with the redraw to run.
+# Keys are weak so destroyed widgets are dropped; bound methods of the widget
+# itself are held as WeakMethod so the value does not keep the key alive.
+_pending: "weakref.WeakKeyDictionary[tk.Misc, Callable[[], Callable[[], None]]]" = \
+    weakref.WeakKeyDictionary()
+
+# Tk roots (one per interpreter) that already have the <Map> hook bound
+_hooked_roots: "weakref.WeakSet[tk.Misc]" = weakref.WeakSet()
+
+def defer_while_hidden(widget: tk.Misc, redraw: Callable[[], None]) -> bool:
+    """
+    Postpone a redraw while the widget is not viewable.
+
+    A hidden notebook tab or a pooled display unmaps an ancestor, not the
+    canvas itself, so the pending redraws are checked on every <Map> event.
+
+    Args:
+        widget: Widget about to redraw
+        redraw: Redraw to run once the widget is viewable again
+
+    Returns:
+        bool: True if the redraw was deferred and the caller should skip it
+    """
+    if widget.winfo_viewable():
+        _pending.pop(widget, None)
+        return False
+
+    root = widget._root()
+    if root not in _hooked_roots:
+        widget.bind_all("<Map>", _run_pending, add="+")
+        _hooked_roots.add(root)
+
+    if getattr(redraw, "__self__", None) is widget:
+        _pending[widget] = weakref.WeakMethod(redraw)
+    else:
+        _pending[widget] = lambda: redraw
+    return True
+
+def _run_pending(event=None):
+    """Run deferred redraws of widgets that became viewable."""
+    for widget, redraw_ref in list(_pending.items()):
+        try:
+            viewable = widget.winfo_viewable()
+        except tk.TclError:
+            _pending.pop(widget, None)  # Widget destroyed
+            continue
+        if viewable:
+            _pending.pop(widget, None)
+            redraw = redraw_ref()
+            if redraw is not None:
+                redraw()
@@ -4,12 +4,17 @@ Provides a canvas widget for displaying servo motor positions
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
+from .deferred_draw import defer_while_hidden
 import math
-import logging
 
 class ServoVisualizer(tk.Canvas):
     """Visualizes dual servo positions with linear displacement."""
     
+    # Fonts shared by all instances, created with the first one
+    _label_font: tkfont.Font = None
+    _value_font: tkfont.Font = None
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self.width = kwargs.get('width', 400)
@@ -24,22 +29,30 @@ class ServoVisualizer(tk.Canvas):
         
         self.PATTERN_TO_ANGLE = [66, 84, 37, 128, 51, 26, 22, 0]
         self.STEP_DISTANCE = 2.1875
+
+        # Lookup tables for _angle_to_position
+        self._angle_to_idx = {angle: i for i, angle in enumerate(self.PATTERN_TO_ANGLE)}
+        self._displacements = tuple(round(i * self.STEP_DISTANCE, 2) for i in range(len(self.PATTERN_TO_ANGLE)))
+        
+        if ServoVisualizer._label_font is None:
+            ServoVisualizer._label_font = tkfont.Font(family="Arial", size=12, weight="bold")
+            ServoVisualizer._value_font = tkfont.Font(family="Arial", size=10)
         
+        self._build_static()
         self.draw_servos()
 
     def _angle_to_position(self, angle):
         """Convert angle to position index and displacement."""
-        try:
-            pos_index = self.PATTERN_TO_ANGLE.index(angle)
-        except ValueError:
+        pos_index = self._angle_to_idx.get(angle)
+        if pos_index is None:
+            # Not an exact table angle: use the nearest one
             pos_index = min(range(len(self.PATTERN_TO_ANGLE)), 
                           key=lambda i: abs(self.PATTERN_TO_ANGLE[i] - angle))
         
-        displacement = pos_index * self.STEP_DISTANCE
-        return pos_index, round(displacement, 2)
+        return pos_index, self._displacements[pos_index]
 
-    def draw_servos(self):
-        """Draw combined servo visualization with improved layout."""
+    def _build_static(self):
+        """Create all canvas items once; only bars and value labels change later."""
         self.delete("all")
         
         # Dark outer box (for labels and angles)
@@ -50,22 +63,15 @@ class ServoVisualizer(tk.Canvas):
         
         # Inner lighter box (movement area)
         inner_margin = 60
-        movement_box = self.create_rectangle(inner_margin, inner_margin, 
-                                          self.width-inner_margin, self.height-inner_margin,
-                                          fill="light gray", width=1)
-        
-        # Calculate positions
-        _, disp_a = self._angle_to_position(self.angle_a)
-        _, disp_b = self._angle_to_position(self.angle_b)
+        self.create_rectangle(inner_margin, inner_margin, 
+                            self.width-inner_margin, self.height-inner_margin,
+                            fill="light gray", width=1)
         
         # Bar dimensions
-        bar_width = 40
+        self._bar_width = 40
         bar_height = 20
-        max_travel = self.width - (2 * inner_margin + bar_width)
-        
-        # Map displacements to pixel positions
-        pos_a = inner_margin + (disp_a / (7 * self.STEP_DISTANCE)) * max_travel
-        pos_b = self.width - inner_margin - bar_width - (disp_b / (7 * self.STEP_DISTANCE)) * max_travel
+        self._inner_margin = inner_margin
+        self._max_travel = self.width - (2 * inner_margin + self._bar_width)
         
         # Label backgrounds
         # Servo A (bottom left)
@@ -80,47 +86,86 @@ class ServoVisualizer(tk.Canvas):
         # Labels
         self.create_text(outer_margin+15, self.height-outer_margin-30,
                         text="Servo A", anchor="w", 
-                        font=("Arial", 12, "bold"), fill="white")
+                        font=self._label_font, fill="white")
         self.create_text(self.width-outer_margin-15, outer_margin+15,
                         text="Servo B", anchor="e", 
-                        font=("Arial", 12, "bold"), fill="white")
+                        font=self._label_font, fill="white")
         
-        # Draw moving bars (entirely within light grey box)
+        # Moving bars (entirely within light grey box), placed by _update_dynamic
         # Adjusted vertical positions to ensure bars stay within light grey area
         servo_spacing = (self.height - 2 * inner_margin - 2 * bar_height) // 3
         
         # Servo B bar (top)
-        self.create_rectangle(pos_b, 
-                            inner_margin + servo_spacing, 
-                            pos_b + bar_width,
-                            inner_margin + servo_spacing + bar_height,
-                            fill="black")
+        self._bar_b_y = (inner_margin + servo_spacing,
+                         inner_margin + servo_spacing + bar_height)
+        self._bar_b_id = self.create_rectangle(0, self._bar_b_y[0], 0, self._bar_b_y[1], fill="black")
         
         # Servo A bar (bottom)
-        self.create_rectangle(pos_a,
-                            self.height - inner_margin - servo_spacing - bar_height,
-                            pos_a + bar_width,
-                            self.height - inner_margin - servo_spacing,
-                            fill="black")
+        self._bar_a_y = (self.height - inner_margin - servo_spacing - bar_height,
+                         self.height - inner_margin - servo_spacing)
+        self._bar_a_id = self.create_rectangle(0, self._bar_a_y[0], 0, self._bar_a_y[1], fill="black")
+        self._bar_a_x = self._bar_b_x = None  # Bar left edges, set on first placement
         
         # Value labels
-        self.create_text(outer_margin+65, self.height-outer_margin-15,
-                        text=f"{self.angle_a}° | {disp_a:.2f}mm",
-                        anchor="w", font=("Arial", 10), fill="white")
+        self._value_a_id = self.create_text(outer_margin+65, self.height-outer_margin-15,
+                        text="", anchor="w", font=self._value_font, fill="white")
         
-        self.create_text(self.width-outer_margin-65, outer_margin+30,
-                        text=f"{self.angle_b}° | {disp_b:.2f}mm",
-                        anchor="e", font=("Arial", 10), fill="white")
+        self._value_b_id = self.create_text(self.width-outer_margin-65, outer_margin+30,
+                        text="", anchor="e", font=self._value_font, fill="white")
+        self._last_label_a = self._last_label_b = ""
 
-    def set_angle(self, angle_a: float, angle_b: float):
-        """Update both servo angles."""
-        try:
-            if self.prev_angle_a != angle_a or self.prev_angle_b != angle_b:
-                self.angle_a = angle_a
-                self.angle_b = angle_b
-                self.prev_angle_a = angle_a
-                self.prev_angle_b = angle_b
+    def _update_dynamic(self, disp_a: float, disp_b: float):
+        """Move the bars and rewrite the value labels for the given displacements."""
+        full_travel = 7 * self.STEP_DISTANCE
+        
+        # Map displacements to pixel positions
+        pos_a = self._inner_margin + (disp_a / full_travel) * self._max_travel
+        pos_b = self.width - self._inner_margin - self._bar_width - (disp_b / full_travel) * self._max_travel
+        
+        # Bars keep their shape, so later updates only shift them horizontally
+        if self._bar_a_x is None:
+            self.coords(self._bar_a_id, pos_a, self._bar_a_y[0], pos_a + self._bar_width, self._bar_a_y[1])
+            self.coords(self._bar_b_id, pos_b, self._bar_b_y[0], pos_b + self._bar_width, self._bar_b_y[1])
+        else:
+            dx_a = pos_a - self._bar_a_x
+            if dx_a:
+                self.move(self._bar_a_id, dx_a, 0)
+            dx_b = pos_b - self._bar_b_x
+            if dx_b:
+                self.move(self._bar_b_id, dx_b, 0)
+        self._bar_a_x = pos_a
+        self._bar_b_x = pos_b
+        # Only relayout a value label whose text actually changed
+        label_a = "%s° | %.2fmm" % (self.angle_a, disp_a)
+        if label_a != self._last_label_a:
+            self.itemconfigure(self._value_a_id, text=label_a)
+            self._last_label_a = label_a
+        label_b = "%s° | %.2fmm" % (self.angle_b, disp_b)
+        if label_b != self._last_label_b:
+            self.itemconfigure(self._value_b_id, text=label_b)
+            self._last_label_b = label_b
+
+    def draw_servos(self):
+        """Draw the current servo positions."""
+        # Hidden displays keep their state and catch up once shown
+        if defer_while_hidden(self, self.draw_servos):
+            return
+        # Calculate positions
+        _, disp_a = self._angle_to_position(self.angle_a)
+        _, disp_b = self._angle_to_position(self.angle_b)
+        self._update_dynamic(disp_a, disp_b)
+
+    def set_angle(self, angle_a: float, angle_b: float, redraw: bool = True):
+        """Update both servo angles; with redraw=False the caller calls draw_servos() later."""
+        if self.prev_angle_a != angle_a or self.prev_angle_b != angle_b:
+            self.angle_a = angle_a
+            self.angle_b = angle_b
+            self.prev_angle_a = angle_a
+            self.prev_angle_b = angle_b
+            # Tk redraws at the next idle point; call flush() to force it
+            if redraw:
                 self.draw_servos()
-                self.update()
-        except Exception as e:
-            logging.error(f"Error setting servo angles: {e}")
\ No newline at end of file
+
+    def flush(self):
+        """Redraw pending changes now, for callers that need them on screen."""
+        self.update_idletasks()
\ No newline at end of file
@@ -3,12 +3,15 @@ from tkinter import ttk, messagebox, filedialog
 import serial
 import serial.tools.list_ports
 import threading
+import queue
 import time
 import json
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 import logging
-import re
 import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Import the OCR module
 import braille_controller.brailleOCR as brailleOCR
@@ -21,6 +24,76 @@ logging.basicConfig(
         logging.StreamHandler()
     ]
 )
+log = logging.getLogger(__name__)
+
+_BINARY_DIGITS = frozenset("01")
+
+
+def _parse_character(rest: str) -> tuple:
+    """Parses the " x -> Pattern: 101000 ..." remainder of a Character line."""
+    head, sep, tail = rest.partition("->")
+    if not sep or "->" in tail:
+        return (None,)
+    char = head.strip()
+    start = tail.find("Pattern:")
+    if start < 0:
+        return ("char", char, None)
+    pattern = tail[start + 8:].lstrip()[:6]
+    if len(pattern) != 6 or not _BINARY_DIGITS.issuperset(pattern):
+        pattern = ""
+    return ("char", char, pattern)
+
+
+def _parse_servo(line: str) -> tuple:
+    """Collects up to two "<digits>µs" pulse widths from a Servo line."""
+    pulses = []
+    end = line.find("µs")
+    while end >= 0:
+        start = end
+        while start > 0 and line[start - 1].isdigit():
+            start -= 1
+        if start < end:
+            pulses.append(int(line[start:end]))
+            if len(pulses) == 2:
+                break
+        end = line.find("µs", end + 2)
+    if pulses:
+        return ("servo", pulses[0], pulses[-1])
+    return (None,)
+
+
+def _parse_line(line: str) -> tuple:
+    """
+    Parses one Arduino status line, dispatching on its leading token.
+
+    Args:
+        line: Stripped line read from the serial port.
+
+    Returns:
+        ("char", char, pattern) for "Character: x -> Pattern: 101000" lines,
+        where pattern is None when the line carries no pattern and "" when
+        the pattern is malformed; ("servo", pulse_a, pulse_b) for lines
+        starting with a servo pulse report; (None,) for anything else.
+    """
+    tag, sep, rest = line.partition(":")
+    if not sep:
+        return (None,)
+    if tag == "Character":
+        return _parse_character(rest)
+    if tag.startswith("Servo"):
+        return _parse_servo(rest)
+    return (None,)
+
+# Serial-to-UI updates are applied at most once per frame (~60 Hz)
+UI_PUMP_INTERVAL_MS = 16
+UI_PUMP_MAX_ITEMS = 256
+# The serial port is polled from the Tk event loop instead of a reader thread
+SERIAL_POLL_INTERVAL_MS = 10
+# Longest wait for the Arduino's startup banner after the DTR reset
+ARDUINO_BOOT_TIMEOUT_MS = 2000
+ARDUINO_READY_BANNER = b"Controller Ready"
+# Quiet period before a settings checkbox change is saved and sent
+CONFIG_DEBOUNCE_MS = 250
 
 # --- Class Definitions ---
 
@@ -29,35 +102,61 @@ class BraillePatternCanvas(tk.Canvas):
         super().__init__(parent, **kwargs)
         self.dot_radius = 10
         self.dot_spacing = 30
-        self.dots_state = [[False] * 2 for _ in range(3)]  # 3x2 grid for Braille
+        self._state_bits = 0  # Raised dots as a 6-bit int, MSB = pattern[0]
+        self.dot_ids = [[None] * 2 for _ in range(3)]  # Oval item per dot, created once
+        self._last_pattern = None
+        self._dot_bboxes = self._compute_dot_bboxes()
         self.configure(width=self.dot_spacing * 3 + 20, height=self.dot_spacing * 4)
-        self.draw_pattern()
+        self._init_pattern()
 
-    def draw_pattern(self):
-        self.delete("all")
+    def _compute_dot_bboxes(self):
+        """Bounding box (x1, y1, x2, y2) of every dot, indexed like dots_state."""
+        r = self.dot_radius
+        bboxes = []
         for i in range(3):
+            x = 20 + (i * self.dot_spacing)
+            row = []
             for j in range(2):
-                x = 20 + (i * self.dot_spacing)
                 y = 20 + (j * self.dot_spacing)
-                color = "black" if self.dots_state[i][j] else "lightgray"
-                self.create_oval(
-                    x - self.dot_radius,
-                    y - self.dot_radius,
-                    x + self.dot_radius,
-                    y + self.dot_radius,
+                row.append((x - r, y - r, x + r, y + r))
+            bboxes.append(row)
+        return bboxes
+
+    def _init_pattern(self):
+        """Create the dot ovals once; updates only recolor them."""
+        self.delete("all")
+        for i in range(3):
+            for j in range(2):
+                color = "black" if self._state_bits >> (5 - (j * 3 + i)) & 1 else "lightgray"
+                self.dot_ids[i][j] = self.create_oval(
+                    *self._dot_bboxes[i][j],
                     fill=color,
                     outline="gray"
                 )
+        # Oval for each bit of _state_bits, LSB first (bit k is pattern[5 - k])
+        self._bit_dot_ids = tuple(self.dot_ids[(5 - k) % 3][(5 - k) // 3] for k in range(6))
+
+    @property
+    def dots_state(self):
+        """3x2 grid of booleans, True where a dot is raised."""
+        bits = self._state_bits
+        return [[bool(bits >> (5 - (j * 3 + i)) & 1) for j in range(2)] for i in range(3)]
 
     def update_pattern(self, pattern: str):
         """Update pattern using 6-bit binary string"""
-        bits = [bool(int(b)) for b in pattern.zfill(6)]
-        self.dots_state = [
-            [bits[0], bits[3]],
-            [bits[1], bits[4]],
-            [bits[2], bits[5]]
-        ]
-        self.draw_pattern()
+        if pattern == self._last_pattern:
+            return
+        new_bits = int(pattern, 2)
+        changed = new_bits ^ self._state_bits
+        # Raw Tcl calls skip itemconfigure's option-dict handling
+        call, widget, dot_ids = self.tk.call, self._w, self._bit_dot_ids
+        while changed:
+            bit = changed & -changed
+            k = bit.bit_length() - 1
+            call(widget, "itemconfigure", dot_ids[k], "-fill", "black" if new_bits & bit else "lightgray")
+            changed ^= bit
+        self._state_bits = new_bits
+        self._last_pattern = pattern
 
 
 class ServoVisualizer(tk.Canvas):
@@ -65,6 +164,9 @@ class ServoVisualizer(tk.Canvas):
     Implements a precise servo motor visualization system with integrated
     geometric transformations and dynamic state management.
     """
+    # Shaft length in pixels, from the base center to its tip
+    SHAFT_LENGTH = 25
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         # Fundamental geometric parameters
@@ -76,33 +178,31 @@ class ServoVisualizer(tk.Canvas):
         self.angle = 0
         self.previous_angle = None
 
-        # Initial rendering
+        # Initial rendering: static items once, then the current angle
+        self._build_static()
         self.draw_servo()
 
-    def draw_servo(self):
+    def _build_static(self):
         """
-        Executes geometric rendering of servo mechanism through
-        parametric transformations and vector calculations.
+        Creates the servo base, shaft and angle label once; later frames
+        only move the shaft and rewrite the label.
         """
-        logging.debug(f"Redrawing servo at angle: {self.angle}°")
-        
         # Clear previous rendering state
         self.delete("all")
 
         # Geometric constants
         BASE_WIDTH = 100
         BASE_HEIGHT = 40
-        SHAFT_LENGTH = 25
 
         # Coordinate system transformation
-        center_x = self.width // 2
-        center_y = self.height // 2
+        self.center_x = self.width // 2
+        self.center_y = self.height // 2
 
         # Servo base visualization
-        x1 = center_x - BASE_WIDTH // 2
-        y1 = center_y - BASE_HEIGHT // 2
-        x2 = center_x + BASE_WIDTH // 2
-        y2 = center_y + BASE_HEIGHT // 2
+        x1 = self.center_x - BASE_WIDTH // 2
+        y1 = self.center_y - BASE_HEIGHT // 2
+        x2 = self.center_x + BASE_WIDTH // 2
+        y2 = self.center_y + BASE_HEIGHT // 2
 
         self.create_rectangle(
             x1, y1, x2, y2,
@@ -111,55 +211,80 @@ class ServoVisualizer(tk.Canvas):
             width=2
         )
 
-        # Angular transformation computation
-        theta = math.radians(self.angle)
-        shaft_x = center_x + SHAFT_LENGTH * math.cos(theta)
-        shaft_y = center_y - SHAFT_LENGTH * math.sin(theta)  # Inverted y-axis
-
-        # Shaft vector rendering
-        self.create_line(
-            center_x, center_y,
-            shaft_x, shaft_y,
+        # Shaft vector, positioned by _update_dynamic
+        self.shaft_id = self.create_line(
+            self.center_x, self.center_y,
+            self.center_x, self.center_y,
             width=3,
             fill="black",
             capstyle=tk.ROUND
         )
 
         # Angular position indicator
-        angle_text = f"{self.angle:.1f}°"
-        self.create_text(
+        self.text_id = self.create_text(
             x2 + 10,
             y1,
-            text=angle_text,
+            text="",
             anchor="w",
             font=("Arial", 10, "bold")
         )
 
-        # Force a redraw of the canvas
-        self.update_idletasks()
+    def _update_dynamic(self):
+        """Moves the shaft and rewrites the angle label for the current angle."""
+        # Angular transformation computation
+        theta = math.radians(self.angle)
+        shaft_x = self.center_x + self.SHAFT_LENGTH * math.cos(theta)
+        shaft_y = self.center_y - self.SHAFT_LENGTH * math.sin(theta)  # Inverted y-axis
+
+        # Two raw Tcl commands per frame; no coordinate flattening or option dicts
+        call, widget = self.tk.call, self._w
+        call(widget, "coords", self.shaft_id, self.center_x, self.center_y, shaft_x, shaft_y)
+        call(widget, "itemconfigure", self.text_id, "-text", f"{self.angle:.1f}°")
+
+    def draw_servo(self):
+        """
+        Executes geometric rendering of servo mechanism through
+        parametric transformations and vector calculations.
+        """
+        log.debug("Redrawing servo at angle: %s°", self.angle)
+        # Tk coalesces the item changes into its next idle redraw
+        self._update_dynamic()
 
-    def set_angle(self, angle: float):
+    def set_angle(self, angle: float, flush: bool = False):
         """
         Updates servo angular position with boundary validation
         and state management.
 
         Parameters:
             angle (float): Target angle in degrees [0, 180]
+            flush (bool): Paint immediately instead of at Tk's next idle pass
         """
-        # Boundary constraint application
-        angle = max(0, min(180, float(angle)))
+        # Boundary constraint application, quantized to the label's precision
+        angle = round(max(0, min(180, float(angle))), 1)
 
-        # State change detection
-        if self.previous_angle != angle:
-            logging.debug(f"Updating servo angle from {self.previous_angle}° to {angle}°")
-            self.previous_angle = angle
-            self.angle = angle
-            self.draw_servo()
-        else:
-            logging.debug(f"Servo angle unchanged at {angle}°")
+        # State change detection; sub-0.1° noise would not change the drawing
+        if self.previous_angle is not None and abs(self.previous_angle - angle) < 0.05:
+            return
+        log.debug("Updating servo angle from %s° to %s°", self.previous_angle, angle)
+        self.previous_angle = angle
+        self.angle = angle
+        self.draw_servo()
+        if flush:
+            self.update_idletasks()
+
+
+@lru_cache(maxsize=4)
+def _load_config_file(path: str, mtime: float) -> Dict:
+    """
+    Reads and parses a configuration file. Results are cached per
+    (path, mtime), so the file is only parsed again after it changes.
+    """
+    with open(path, "r") as f:
+        return json.load(f)
 
 
 class Configuration:
+    CONFIG_FILE = "braille_config.json"
     DEFAULT_CONFIG = {
         "char_delay": 3000,
         "servo_delay": 750,
@@ -168,50 +293,140 @@ class Configuration:
         "theme": "default"
     }
 
-    def __init__(self):
+    def __init__(self, on_save_error: Optional[Callable[[Exception], None]] = None):
+        """
+        Args:
+            on_save_error: Called from the save worker thread when a
+                background write fails
+        """
         self.config = self.DEFAULT_CONFIG.copy()
+        self._dirty = False
+        self.on_save_error = on_save_error
+        # Single worker so queued saves land on disk in order
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-save")
         self.load_config()
 
     def load_config(self):
         try:
-            with open("braille_config.json", "r") as f:
-                loaded_config = json.load(f)
-                self.config.update(loaded_config)
-                logging.debug("Configuration loaded from braille_config.json.")
+            mtime = os.path.getmtime(self.CONFIG_FILE)
+            self.config.update(_load_config_file(self.CONFIG_FILE, mtime))
+            log.debug(f"Configuration loaded from {self.CONFIG_FILE}.")
         except FileNotFoundError:
-            logging.warning("braille_config.json not found. Creating default configuration.")
+            log.warning(f"{self.CONFIG_FILE} not found. Creating default configuration.")
             self.save_config()
 
-    def save_config(self):
+    def save_config(self, wait: bool = False) -> bool:
+        """
+        Serializes the configuration and hands the file write to the save worker.
+
+        Args:
+            wait: Block until the file is written and report failures here
+                instead of through on_save_error
+
+        Returns:
+            False if the configuration could not be saved (or, without wait,
+            serialized), True otherwise.
+        """
         try:
-            with open("braille_config.json", "w") as f:
-                json.dump(self.config, f, indent=4)
-                logging.debug("Configuration saved to braille_config.json.")
+            data = json.dumps(self.config, indent=4).encode()
         except Exception as e:
-            logging.error(f"Failed to save configuration: {e}")
+            log.error(f"Failed to save configuration: {e}")
             messagebox.showerror("Save Error", f"Failed to save configuration.\nError: {e}")
+            return False
+        future = self._save_executor.submit(self._write_atomic, data)
+        self._dirty = False
+        if not wait:
+            future.add_done_callback(self._on_write_done)
+            return True
+
+        error = future.exception()
+        if error is not None:
+            self._dirty = True  # Retried by the next flush
+            messagebox.showerror("Save Error", f"Failed to save configuration.\nError: {error}")
+            return False
+        return True
+
+    def _write_atomic(self, data: bytes):
+        """Writes data to a temporary file and swaps it into place."""
+        tmp_path = self.CONFIG_FILE + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.CONFIG_FILE)
+            log.debug(f"Configuration saved to {self.CONFIG_FILE}.")
+        except Exception as e:
+            log.error(f"Failed to save configuration: {e}")
+            raise
+
+    def _on_write_done(self, future):
+        """Marks the configuration dirty again and reports a failed background write."""
+        error = future.exception()
+        if error is None:
+            return
+        self._dirty = True  # Retried by the next flush
+        if self.on_save_error is not None:
+            self.on_save_error(error)
+
+    def flush(self, wait: bool = False) -> bool:
+        """Writes the configuration to disk if it changed since the last save."""
+        if not self._dirty:
+            return True
+        return self.save_config(wait=wait)
+
+    def close(self):
+        """Flushes pending changes and waits for outstanding writes to finish."""
+        self._save_executor.submit(lambda: None).result()  # Let queued writes settle
+        self.flush(wait=True)
+        self._save_executor.shutdown(wait=True)
 
     def get(self, key: str):
         return self.config.get(key, self.DEFAULT_CONFIG.get(key))
 
     def set(self, key: str, value):
+        if key in self.config and self.config[key] == value:
+            return
         self.config[key] = value
-        self.save_config()
-        logging.debug(f"Configuration updated: {key} = {value}")
+        self._dirty = True
+        log.debug(f"Configuration updated: {key} = {value}")
+
+    def set_many(self, items: Dict) -> bool:
+        """
+        Applies several settings and saves them with a single write,
+        waiting for the write so failures are reported to the caller.
+
+        Returns:
+            False if the configuration could not be saved, True otherwise.
+        """
+        changed = {k: v for k, v in items.items() if k not in self.config or self.config[k] != v}
+        if changed:
+            self.config.update(changed)
+            self._dirty = True
+            log.debug(f"Configuration updated: {changed}")
+        return self.flush(wait=True)
 
 
 # --- Main GUI Class ---
 
 class BrailleControllerGUI:
+    # Servo pulse width range (µs) and its degrees-per-µs slope over 0-180°
+    _MIN_PULSE = 500
+    _MAX_PULSE = 2500
+    _PULSE_SCALE = 180.0 / (_MAX_PULSE - _MIN_PULSE)
+
     def __init__(self, root):
         self.root = root
         self.root.title("Braille Controller Interface")
-        self.config = Configuration()
+        self.config = Configuration(on_save_error=self._on_config_save_error)
         self.setup_styles()
         self.create_gui()
         self.setup_variables()
         self.setup_bindings()
-        logging.debug("Initialized BrailleControllerGUI")
+        log.debug("Initialized BrailleControllerGUI")
+
+    def _on_config_save_error(self, error: Exception):
+        """Reports a failed background configuration write; called off the UI thread."""
+        self.root.after(0, messagebox.showerror, "Save Error",
+                        f"Failed to save configuration.\nError: {error}")
 
     def setup_styles(self):
         style = ttk.Style()
@@ -220,37 +435,37 @@ class BrailleControllerGUI:
                   foreground=[('active', 'white')],
                   background=[('active', 'green')])
         style.configure("Warning.TLabel", foreground="red")
-        logging.debug("Styles configured.")
+        log.debug("Styles configured.")
 
     def create_gui(self):
         # Create notebook for tabbed interface
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(expand=True, fill="both", padx=5, pady=5)
-        logging.debug("Notebook for tabs created.")
+        log.debug("Notebook for tabs created.")
 
         # Main control tab
         self.main_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.main_tab, text="Control")
         self.create_main_tab()
-        logging.debug("Main Control tab created.")
+        log.debug("Main Control tab created.")
 
         # Configuration tab
         self.config_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.config_tab, text="Configuration")
         self.create_config_tab()
-        logging.debug("Configuration tab created.")
+        log.debug("Configuration tab created.")
 
         # Visualization tab
         self.visual_tab = ttk.Frame(self.notebook)
         self.notebook.add(self.visual_tab, text="Visualization")
         self.create_visual_tab()
-        logging.debug("Visualization tab created.")
+        log.debug("Visualization tab created.")
 
     def create_main_tab(self):
         # Connection Frame
         self.connection_frame = ttk.LabelFrame(self.main_tab, text="Connection", padding="5")
         self.connection_frame.pack(fill="x", padx=5, pady=5)
-        logging.debug("Connection frame created.")
+        log.debug("Connection frame created.")
 
         # Port selection and connection controls
         self.port_frame = ttk.Frame(self.connection_frame)
@@ -272,7 +487,7 @@ class BrailleControllerGUI:
         # Text Input Frame
         self.input_frame = ttk.LabelFrame(self.main_tab, text="Text Input", padding="5")
         self.input_frame.pack(fill="x", padx=5, pady=5)
-        logging.debug("Text Input frame created.")
+        log.debug("Text Input frame created.")
 
         self.text_input = ttk.Entry(self.input_frame)
         self.text_input.pack(side="left", padx=5, pady=5, expand=True, fill="x")
@@ -287,7 +502,7 @@ class BrailleControllerGUI:
         # Status Frame
         self.status_frame = ttk.LabelFrame(self.main_tab, text="Status", padding="5")
         self.status_frame.pack(fill="x", padx=5, pady=5)
-        logging.debug("Status frame created.")
+        log.debug("Status frame created.")
 
         self.status_label = ttk.Label(self.status_frame, text="Disconnected")
         self.status_label.pack(padx=5, pady=5)
@@ -302,7 +517,7 @@ class BrailleControllerGUI:
         # Timing Configuration
         timing_frame = ttk.LabelFrame(self.config_tab, text="Timing Configuration", padding="5")
         timing_frame.pack(fill="x", padx=5, pady=5)
-        logging.debug("Timing Configuration frame created.")
+        log.debug("Timing Configuration frame created.")
 
         # Character Delay
         ttk.Label(timing_frame, text="Character Delay (ms):").pack(anchor="w", padx=5, pady=(5, 0))
@@ -319,7 +534,7 @@ class BrailleControllerGUI:
         # Servo Configuration
         servo_frame = ttk.LabelFrame(self.config_tab, text="Servo Configuration", padding="5")
         servo_frame.pack(fill="x", padx=5, pady=5)
-        logging.debug("Servo Configuration frame created.")
+        log.debug("Servo Configuration frame created.")
 
         # Dual Servo Mode
         self.dual_servo_var = tk.BooleanVar(value=self.config.get("dual_servo_mode"))
@@ -339,7 +554,7 @@ class BrailleControllerGUI:
         # Save Button
         save_button = ttk.Button(self.config_tab, text="Save Configuration", command=self.save_configuration)
         save_button.pack(pady=10)
-        logging.debug("Save Configuration button created.")
+        log.debug("Save Configuration button created.")
 
     def create_visual_tab(self):
         """
@@ -367,38 +582,61 @@ class BrailleControllerGUI:
     def setup_variables(self):
         self.serial_connection = None
         self.is_connected = False
+        self._poll_id = None
+        self._handshake_id = None
+        self._rx_buffer = bytearray()
         self.last_pattern = "000000"
+        self.ui_queue = queue.Queue()
+        self._ui_handlers = (
+            ("char", self.update_display),
+            ("pattern", self.update_pattern),
+            ("servo", self.update_servo_positions),
+        )
+        self._pump_id = self.root.after(UI_PUMP_INTERVAL_MS, self._pump_ui)
+        self._last_ports = None
+        self._pending_cfg_id = None
         self.refresh_ports()
-        logging.debug("Variables setup completed.")
+        log.debug("Variables setup completed.")
 
     def setup_bindings(self):
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.text_input.bind('<Return>', lambda e: self.send_text())
-        logging.debug("Event bindings set up.")
+        log.debug("Event bindings set up.")
 
     def refresh_ports(self):
-        ports = [port.device for port in serial.tools.list_ports.comports()]
+        """Rescans serial ports in the background; the combobox updates only if they changed."""
+        threading.Thread(target=self._scan_ports, daemon=True).start()
+
+    def _scan_ports(self):
+        """Enumerates serial ports off the UI thread."""
+        try:
+            ports = tuple(sorted(port.device for port in serial.tools.list_ports.comports()))
+        except Exception as e:
+            log.error(f"Failed to enumerate serial ports: {e}")
+            return
+        if ports != self._last_ports:
+            self.root.after(0, self._apply_ports, ports)
+
+    def _apply_ports(self, ports: tuple):
+        self._last_ports = ports
         self.port_combo['values'] = ports
         if ports:
-            self.port_combo.set(ports[0])
-            logging.info(f"Available serial ports: {ports}")
+            if self.port_var.get() not in ports:
+                self.port_combo.set(ports[0])
+            log.info(f"Available serial ports: {list(ports)}")
         else:
             self.port_combo.set('')
-            logging.warning("No serial ports found.")
+            log.warning("No serial ports found.")
 
     def toggle_connection(self):
         if not self.is_connected:
             try:
                 self.connect()
             except Exception as e:
-                logging.error(f"Failed to toggle connection: {e}")
+                log.error(f"Failed to toggle connection: {e}")
                 messagebox.showerror("Connection Error", f"Failed to connect: {e}")
         else:
             self.disconnect()
-            # Ensure thread termination
-            if hasattr(self, 'read_thread') and self.read_thread.is_alive():
-                self.read_thread.join(timeout=1)
-                logging.debug("Serial read thread terminated.")
 
     def connect(self):
         """
@@ -407,77 +645,135 @@ class BrailleControllerGUI:
         - Port validation
         - Hardware flow control
         - Connection state management
-        - Asynchronous read thread initialization
+        - Serial polling on the Tk event loop
+
+        The port is opened and the Arduino reset here; the connection is
+        completed by _connect_phase2 once the board reports it is ready.
         """
+        if self._handshake_id is not None:
+            log.debug("Connection attempt already in progress.")
+            return
         port = self.port_var.get()
-        logging.debug(f"Attempting to connect to port: {port}")
+        log.debug(f"Attempting to connect to port: {port}")
         if not port:
             messagebox.showwarning("Warning", "No port selected.")
-            logging.warning("No port selected for connection.")
+            log.warning("No port selected for connection.")
             return
         try:
             # Initialize serial connection with specified parameters
             self.serial_connection = serial.Serial(
                 port=port,
                 baudrate=9600,
-                timeout=1,
+                timeout=0,  # Non-blocking; _poll_serial only reads what is already buffered
                 write_timeout=1
             )
-            logging.info(f"Serial connection established on port {port}.")
+            log.info(f"Serial connection established on port {port}.")
 
             # Implement hardware flow control sequence
             self.serial_connection.dtr = False  # Disable Data Terminal Ready
             time.sleep(0.1)
             self.serial_connection.dtr = True   # Enable Data Terminal Ready
-            time.sleep(2)  # Allow sufficient time for Arduino initialization
-            logging.debug("Hardware flow control toggled (DTR).")
-
-            # Update connection state and UI elements
-            self.is_connected = True
-            self.connect_button.configure(text="Disconnect", style="Active.TButton")
-            self.status_label.configure(text=f"Connected to {port}")
-            logging.info(f"Connected to {port}.")
-
-            # Initialize asynchronous read thread
-            self.read_thread = threading.Thread(target=self.read_serial, daemon=True)
-            self.read_thread.start()
-            logging.debug("Serial read thread started.")
+            log.debug("Hardware flow control toggled (DTR).")
+
+            # Wait for the Arduino to boot without blocking the UI
+            self.status_label.configure(text=f"Connecting to {port}...")
+            self._rx_buffer = bytearray()
+            deadline = time.monotonic() + ARDUINO_BOOT_TIMEOUT_MS / 1000
+            self._handshake_id = self.root.after(
+                SERIAL_POLL_INTERVAL_MS, self._wait_for_ready, port, deadline
+            )
         except Exception as e:
-            logging.error(f"Failed to connect to {port}: {e}")
+            log.error(f"Failed to connect to {port}: {e}")
+            messagebox.showerror("Connection Error", f"Failed to connect to {port}.\nError: {e}")
+
+    def _wait_for_ready(self, port: str, deadline: float):
+        """
+        Polls for the Arduino's startup banner, finishing the connection as
+        soon as it appears or once the boot timeout has elapsed.
+        """
+        self._handshake_id = None
+        try:
+            waiting = self.serial_connection.in_waiting
+            if waiting:
+                self._rx_buffer += self.serial_connection.read(waiting)
+        except Exception as e:
+            log.error(f"Failed to connect to {port}: {e}")
+            self.disconnect()
             messagebox.showerror("Connection Error", f"Failed to connect to {port}.\nError: {e}")
+            return
+
+        if ARDUINO_READY_BANNER in self._rx_buffer:
+            log.debug("Arduino ready banner received.")
+        elif time.monotonic() < deadline:
+            self._handshake_id = self.root.after(
+                SERIAL_POLL_INTERVAL_MS, self._wait_for_ready, port, deadline
+            )
+            return
+        else:
+            log.debug("No ready banner before timeout; assuming Arduino initialized.")
+        self._connect_phase2(port)
+
+    def _connect_phase2(self, port: str):
+        """Marks the connection live and starts polling for Arduino messages."""
+        try:
+            # Drop boot-time output once; later sends must not discard in-flight replies
+            self.serial_connection.reset_input_buffer()
+            self.serial_connection.reset_output_buffer()
+            log.debug("Serial buffers reset.")
+        except Exception as e:
+            log.error(f"Failed to connect to {port}: {e}")
+            self.disconnect()
+            messagebox.showerror("Connection Error", f"Failed to connect to {port}.\nError: {e}")
+            return
+
+        # Update connection state and UI elements
+        self.is_connected = True
+        self.connect_button.configure(text="Disconnect", style="Active.TButton")
+        self.status_label.configure(text=f"Connected to {port}")
+        log.info(f"Connected to {port}.")
+
+        # Start polling the port from the UI thread
+        self._rx_buffer = bytearray()
+        self._poll_id = self.root.after(SERIAL_POLL_INTERVAL_MS, self._poll_serial)
+        log.debug("Serial polling started.")
 
     def disconnect(self):
+        if self._handshake_id is not None:
+            self.root.after_cancel(self._handshake_id)
+            self._handshake_id = None
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
         if self.serial_connection and self.serial_connection.is_open:
             self.serial_connection.close()
-            logging.info("Serial connection closed.")
+            log.info("Serial connection closed.")
         self.is_connected = False
         self.connect_button.configure(text="Connect", style="TButton")
         self.status_label.configure(text="Disconnected")
         self.char_display.configure(text="Current Character: -")
         self.progress['value'] = 0
-        logging.debug("Disconnected from serial port and UI reset.")
+        log.debug("Disconnected from serial port and UI reset.")
 
     def send_text(self):
         """
         Transmits formatted commands to Arduino with comprehensive error handling.
         Implements:
         - Input validation
-        - Buffer management
         - Error handling
         - Connection state verification
         """
-        logging.debug("send_text called")
+        log.debug("send_text called")
         # Verify connection state
         if not self.is_connected:
-            logging.warning("Attempted to send text without an active connection.")
+            log.warning("Attempted to send text without an active connection.")
             messagebox.showwarning("Warning", "Please connect to Arduino first.")
             return
 
         # Validate input text
         text = self.text_input.get().strip()
-        logging.debug(f"Text input received: '{text}'")
+        log.debug(f"Text input received: '{text}'")
         if not text:
-            logging.warning("No text entered to send.")
+            log.warning("No text entered to send.")
             messagebox.showwarning("Warning", "Please enter some text to send.")
             return
 
@@ -485,9 +781,9 @@ class BrailleControllerGUI:
         try:
             char_delay = int(self.char_delay_var.get())
             servo_delay = int(self.servo_delay_var.get())
-            logging.debug(f"Character Delay: {char_delay} ms, Servo Delay: {servo_delay} ms")
+            log.debug(f"Character Delay: {char_delay} ms, Servo Delay: {servo_delay} ms")
         except ValueError as e:
-            logging.error(f"Invalid delay values: {e}")
+            log.error(f"Invalid delay values: {e}")
             messagebox.showerror("Invalid Input", "Please enter valid numerical values for delays.")
             return
 
@@ -500,24 +796,19 @@ class BrailleControllerGUI:
             # Assuming configuration is already handled via checkbox toggle
 
             # Prepare and encode text command
-            logging.debug(f"Text command to send: {text_command}")
-
-            # Clear communication buffers
-            self.serial_connection.reset_input_buffer()
-            self.serial_connection.reset_output_buffer()
-            logging.debug("Serial buffers reset.")
+            log.debug(f"Text command to send: {text_command}")
 
             # Transmit text data
             self.serial_connection.write(text_command.encode())
             self.serial_connection.flush()
-            logging.info("Text data sent to Arduino successfully.")
+            log.info("Text data sent to Arduino successfully.")
 
             # Reset UI elements
             self.progress['value'] = 0
             self.char_display.configure(text="Current Character: -")
-            logging.debug("UI elements reset after sending data.")
+            log.debug("UI elements reset after sending data.")
         except Exception as e:
-            logging.error(f"Failed to send data: {e}")
+            log.error(f"Failed to send data: {e}")
             messagebox.showerror("Send Error", f"Failed to send data.\nError: {e}")
             self.disconnect()  # Terminate connection on critical error
 
@@ -525,160 +816,191 @@ class BrailleControllerGUI:
         """
         Sends configuration commands to Arduino.
         """
-        logging.debug("send_configuration called.")
+        log.debug("send_configuration called.")
         config_command = f"CONFIG:DUAL={int(self.dual_servo_var.get())}\n"
         try:
             self.serial_connection.write(config_command.encode())
             self.serial_connection.flush()
-            logging.info(f"Configuration command sent: {config_command.strip()}")
+            log.info(f"Configuration command sent: {config_command.strip()}")
         except Exception as e:
-            logging.error(f"Failed to send configuration command: {e}")
+            log.error(f"Failed to send configuration command: {e}")
             messagebox.showerror("Send Error", f"Failed to send configuration command.\nError: {e}")
             self.disconnect()
 
-    def read_serial(self):
+    def _poll_serial(self) -> None:
         """
-        Asynchronous serial data reception handler.
-        Implements continuous monitoring of serial input with error handling.
+        Reads whatever the serial driver has buffered and dispatches every
+        complete line. Runs on the Tk event loop, so no reader thread
+        contends with the UI for the GIL.
         """
-        logging.debug("read_serial thread running.")
-        while self.is_connected and self.serial_connection and self.serial_connection.is_open:
-            try:
-                if self.serial_connection.in_waiting:
-                    line = self.serial_connection.readline().decode().strip()
-                    logging.debug(f"Received line from Arduino: '{line}'")
-                    if line:
-                        self.process_serial_message(line)
-                time.sleep(0.1)  # Prevent CPU saturation
-            except serial.SerialException as e:
-                logging.error(f"Serial communication error: {e}")
-                break  # Exit on serial communication error
-            except UnicodeDecodeError as e:
-                logging.warning(f"Unicode decode error: {e}")
-                continue  # Skip malformed data
-            except Exception as e:
-                logging.error(f"Unexpected error in read_serial: {e}")
-                break  # Exit on critical error
+        self._poll_id = None
+        if not (self.is_connected and self.serial_connection and self.serial_connection.is_open):
+            return
+        try:
+            waiting = self.serial_connection.in_waiting
+            if waiting:
+                self._rx_buffer += self.serial_connection.read(waiting)
+                buffer = self._rx_buffer
+                end = buffer.find(b"\n")
+                while end >= 0:
+                    raw = bytes(buffer[:end])
+                    del buffer[:end + 1]
+                    try:
+                        line = raw.decode().strip()
+                    except UnicodeDecodeError as e:
+                        log.warning(f"Unicode decode error: {e}")  # Skip malformed data
+                    else:
+                        log.debug("Received line from Arduino: '%s'", line)
+                        if line:
+                            self.process_serial_message(line)
+                    end = buffer.find(b"\n")
+        except serial.SerialException as e:
+            log.error(f"Serial communication error: {e}")
+            self.disconnect()
+            return
+        except Exception as e:
+            log.error(f"Unexpected error in _poll_serial: {e}")
+            self.disconnect()
+            return
+        self._poll_id = self.root.after(SERIAL_POLL_INTERVAL_MS, self._poll_serial)
 
     def process_serial_message(self, message: str) -> None:
         """
         Processes incoming serial messages from Arduino for visualization updates.
         """
-        logging.debug(f"Processing serial message: '{message}'")
+        log.debug("Processing serial message: '%s'", message)
         try:
-            if "Character:" in message:
-                # Extract character and pattern data
-                parts = message.split("->")
-                if len(parts) == 2:
-                    char = parts[0].split(":")[1].strip()
-                    pattern_info = parts[1].strip()
-                    
-                    # Update character display
-                    self.root.after(0, self.update_display, char)
-                    
-                    # Extract binary pattern
-                    if "Pattern:" in pattern_info:
-                        binary_match = re.search(r'Pattern:\s*([01]{6})', pattern_info)
-                        if binary_match:
-                            binary = binary_match.group(1)
-                            self.root.after(0, self.update_pattern, binary)
-                        else:
-                            logging.error("Binary pattern not found in message.")
-            elif "Servo" in message and "µs" in message:
-                # Process servo position data
-                pulse_matches = re.findall(r'(\d+)µs', message)
-                if len(pulse_matches) >= 1:
-                    pulse_a = int(pulse_matches[0])
-                    pulse_b = pulse_a  # Default if single servo mode
-                    
-                    if len(pulse_matches) >= 2:
-                        pulse_b = int(pulse_matches[1])
-                        
-                    self.root.after(0, self.update_servo_positions, f"{pulse_a},{pulse_b}")
-                    
+            parsed = _parse_line(message)
+            tag = parsed[0]
+            if tag == "char":
+                _, char, pattern = parsed
+                self.ui_queue.put(("char", (char,)))
+                if pattern:
+                    self.ui_queue.put(("pattern", (pattern,)))
+                elif pattern is not None:
+                    log.error("Binary pattern not found in message.")
+            elif tag == "servo":
+                _, pulse_a, pulse_b = parsed
+                self.ui_queue.put(("servo", (pulse_a, pulse_b)))
+
         except Exception as e:
-            logging.error(f"Message processing error: {e}")
+            log.error(f"Message processing error: {e}")
+
+    def _pump_ui(self) -> None:
+        """
+        Drains queued serial updates on the UI thread, applying only the
+        latest character, pattern and servo position received since the
+        previous pump.
+        """
+        latest = {}
+        try:
+            for _ in range(UI_PUMP_MAX_ITEMS):
+                tag, value = self.ui_queue.get_nowait()
+                latest[tag] = value
+        except queue.Empty:
+            pass
+
+        try:
+            for tag, handler in self._ui_handlers:
+                if tag in latest:
+                    # One bad update must not hide the others
+                    try:
+                        handler(*latest[tag])
+                    except Exception as e:
+                        log.error(f"UI update error ({tag}): {e}")
+        finally:
+            # Always re-arm, or serial updates would stop reaching the UI
+            self._pump_id = self.root.after(UI_PUMP_INTERVAL_MS, self._pump_ui)
 
     def update_display(self, char: str) -> None:
         """Updates the character display with progress tracking."""
         self.char_display.configure(text=f"Current Character: {char}")
         self.progress['value'] = (self.progress['value'] + 10) % 100
-        logging.debug(f"Display updated with character: {char}")
+        log.debug("Display updated with character: %s", char)
 
     def update_pattern(self, pattern: str) -> None:
         """Updates Braille pattern visualization."""
         if not pattern or len(pattern) != 6 or not all(bit in '01' for bit in pattern):
-            logging.error(f"Invalid pattern format: {pattern}")
+            log.error(f"Invalid pattern format: {pattern}")
             return
             
         self.pattern_canvas.update_pattern(pattern)
         self.last_pattern = pattern
-        logging.debug(f"Pattern visualization updated: {pattern}")
+        log.debug("Pattern visualization updated: %s", pattern)
 
-    def update_servo_positions(self, positions: str) -> None:
+    def update_servo_positions(self, pulse_a: int, pulse_b: int) -> None:
         """Updates servo position visualizations."""
         try:
-            pulse_a, pulse_b = map(int, positions.split(','))
-            
             # Validate pulse width ranges
             if not (500 <= pulse_a <= 2500 and 500 <= pulse_b <= 2500):
                 raise ValueError("Pulse width out of valid range (500-2500µs)")
                 
-            angle_a = self.pulse_to_angle(pulse_a)
-            angle_b = self.pulse_to_angle(pulse_b)
+            angle_a, angle_b = self._pulses_to_angles(pulse_a, pulse_b)
             
             self.servo_a_canvas.set_angle(angle_a)
             self.servo_b_canvas.set_angle(angle_b)
-            logging.debug(f"Servo visualizations updated - A: {angle_a}°, B: {angle_b}°")
+            log.debug("Servo visualizations updated - A: %s°, B: %s°", angle_a, angle_b)
             
         except Exception as e:
-            logging.error(f"Servo position update error: {e}")
+            log.error(f"Servo position update error: {e}")
 
     def pulse_to_angle(self, pulse_width: int) -> float:
         """Converts servo pulse width to angular position."""
-        MIN_PULSE = 500
-        MAX_PULSE = 2500
-        MIN_ANGLE = 0
-        MAX_ANGLE = 180
-        
-        # Constrain pulse width to valid range
-        pulse_width = max(MIN_PULSE, min(pulse_width, MAX_PULSE))
-        
-        # Linear interpolation
-        angle = (pulse_width - MIN_PULSE) * (MAX_ANGLE - MIN_ANGLE) / (MAX_PULSE - MIN_PULSE) + MIN_ANGLE
-        return round(angle, 2)
+        # Constrain pulse width to valid range, then interpolate linearly
+        pulse_width = max(self._MIN_PULSE, min(pulse_width, self._MAX_PULSE))
+        return round((pulse_width - self._MIN_PULSE) * self._PULSE_SCALE, 2)
+
+    def _pulses_to_angles(self, pulse_a: int, pulse_b: int) -> tuple:
+        """Converts both servo pulse widths to angles in one call."""
+        lo, hi, scale = self._MIN_PULSE, self._MAX_PULSE, self._PULSE_SCALE
+        return (
+            round((max(lo, min(pulse_a, hi)) - lo) * scale, 2),
+            round((max(lo, min(pulse_b, hi)) - lo) * scale, 2),
+        )
 
     def save_configuration(self):
         """
         Validates and saves the current configuration settings.
         """
-        logging.debug("save_configuration called.")
+        log.debug("save_configuration called.")
         # Validate and save configuration
         try:
             char_delay = int(self.char_delay_var.get())
             servo_delay = int(self.servo_delay_var.get())
-            logging.debug(f"Saving configuration: char_delay={char_delay}, servo_delay={servo_delay}")
+            log.debug(f"Saving configuration: char_delay={char_delay}, servo_delay={servo_delay}")
         except ValueError as e:
-            logging.error(f"Invalid delay values during save: {e}")
+            log.error(f"Invalid delay values during save: {e}")
             messagebox.showerror("Invalid Input", "Please enter valid numbers for delays.")
             return
 
-        self.config.set("char_delay", char_delay)
-        self.config.set("servo_delay", servo_delay)
-        self.config.set("dual_servo_mode", self.dual_servo_var.get())
-        self.config.set("debug_mode", self.debug_var.get())
+        if not self.config.set_many({
+            "char_delay": char_delay,
+            "servo_delay": servo_delay,
+            "dual_servo_mode": self.dual_servo_var.get(),
+            "debug_mode": self.debug_var.get(),
+        }):
+            return
 
         messagebox.showinfo("Configuration Saved", "Configuration settings have been saved successfully.")
-        logging.info("Configuration saved successfully.")
+        log.info("Configuration saved successfully.")
 
     def on_dual_servo_toggle(self):
         """
         Handler for Dual Servo Mode checkbox toggle.
-        Sends configuration command to Arduino.
+        Debounced, so a burst of toggles results in one save and one
+        configuration command.
         """
-        logging.debug(f"Dual Servo Mode toggled to {self.dual_servo_var.get()}")
+        log.debug(f"Dual Servo Mode toggled to {self.dual_servo_var.get()}")
+        if self._pending_cfg_id is not None:
+            self.root.after_cancel(self._pending_cfg_id)
+        self._pending_cfg_id = self.root.after(CONFIG_DEBOUNCE_MS, self._apply_dual_servo)
+
+    def _apply_dual_servo(self):
+        """Persists the Dual Servo Mode setting and sends it to the Arduino."""
+        self._pending_cfg_id = None
         # Update configuration
         self.config.set("dual_servo_mode", self.dual_servo_var.get())
+        self.config.flush()
         # Send configuration to Arduino
         if self.is_connected:
             self.send_configuration()
@@ -688,7 +1010,7 @@ class BrailleControllerGUI:
         Handles the image upload process, extracts text using OCR,
         and displays the extracted text for user confirmation before sending.
         """
-        logging.debug("upload_image called.")
+        log.debug("upload_image called.")
         # Open file dialog to select image
         image_path = filedialog.askopenfilename(
             title="Select Image",
@@ -707,18 +1029,18 @@ class BrailleControllerGUI:
         """
         Processes the uploaded image using the OCR function to extract text.
         """
-        logging.debug(f"Processing image: {image_path}")
+        log.debug(f"Processing image: {image_path}")
         try:
             # Extract text from the image
             text = brailleOCR.extract_text_from_image(image_path=image_path)
-            logging.debug(f"Extracted text: '{text}'")
+            log.debug(f"Extracted text: '{text}'")
             if text:
                 # Update the GUI in the main thread
                 self.root.after(0, self.display_extracted_text, text)
             else:
                 self.root.after(0, messagebox.showwarning, "No Text Found", "No text could be extracted from the image.")
         except Exception as e:
-            logging.error(f"Error extracting text from image: {e}")
+            log.error(f"Error extracting text from image: {e}")
             self.root.after(0, messagebox.showerror, "Error", f"Failed to extract text from image.\nError: {e}")
         finally:
             # Re-enable the upload button
@@ -728,27 +1050,34 @@ class BrailleControllerGUI:
         """
         Displays the extracted text in the text input field and notifies the user.
         """
-        logging.debug("Displaying extracted text.")
+        log.debug("Displaying extracted text.")
         # Display the extracted text in the text_input Entry widget
         self.text_input.delete(0, tk.END)
         self.text_input.insert(0, text)
         # Optionally, update the status label or show a message
         messagebox.showinfo("Text Extracted", "Text has been extracted from the image.")
-        logging.info("Extracted text displayed in the input field.")
+        log.info("Extracted text displayed in the input field.")
 
     def on_closing(self):
         """
         Handles the application closure event.
         Ensures proper disconnection and resource cleanup.
         """
-        logging.debug("Application closing initiated.")
+        log.debug("Application closing initiated.")
+        self.root.after_cancel(self._pump_id)
+        if self._pending_cfg_id is not None:
+            self.root.after_cancel(self._pending_cfg_id)
+            self._apply_dual_servo()
         self.disconnect()
+        self.config.close()
         self.root.destroy()
-        logging.info("Application closed.")
+        log.info("Application closed.")
 
 
 # Main application execution
 if __name__ == "__main__":
+    # Load the OCR models in the background so the first upload is fast
+    brailleOCR.warm_up()
     root = tk.Tk()
     app = BrailleControllerGUI(root)
     root.mainloop()
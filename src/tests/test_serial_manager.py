@@ -0,0 +1,98 @@
+"""
+Tests for SerialManager text batching and write failures.
+
+Run from src/: python -m unittest discover -s tests
+"""
+
+import unittest
+
+try:
+    from braille_controller.communication.serial_manager import SerialManager
+except ImportError:  # pyserial not installed
+    SerialManager = None
+
+
+@unittest.skipIf(SerialManager is None, "pyserial is not installed")
+class SendTextBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.manager = SerialManager(lambda line: None)
+        self.manager.is_connected = True  # Commands are only queued, never written
+
+    def _sent_payload(self) -> bytes:
+        command = self.manager._write_queue.get_nowait()
+        self.assertTrue(command.startswith(b"TEXT:") and command.endswith(b"\n"))
+        return command[len(b"TEXT:"):-1]
+
+    def test_batch_stops_at_buffer_size(self):
+        # 330 two-byte groups and their 329 separators take 989 bytes
+        groups = ["ab"] * 330 + ["abc"]  # + separator + 3 = 993 bytes: fits exactly
+        self.assertEqual(self.manager.send_text_batch(groups, 0, 0), 331)
+        self.assertEqual(len(self._sent_payload()), SerialManager.MAX_TEXT_LENGTH)
+
+        groups = ["ab"] * 330 + ["abcd"]  # 994 bytes: last group waits
+        self.assertEqual(self.manager.send_text_batch(groups, 0, 0), 330)
+        self.assertEqual(len(self._sent_payload()), 989)
+
+    def test_oversized_single_group_is_rejected(self):
+        payload_len = SerialManager.MAX_TEXT_LENGTH
+        self.assertEqual(self.manager.send_text_batch(["a" * payload_len], 0, 0), 1)
+        self.assertEqual(len(self._sent_payload()), payload_len)
+        with self.assertRaises(ValueError):
+            self.manager.send_text_batch(["a" * (payload_len + 1)], 0, 0)
+
+    def test_rejects_unsendable_characters(self):
+        with self.assertRaises(ValueError):
+            self.manager.send_text_batch(["ab", "cé"], 0, 0)
+        with self.assertRaises(ValueError):
+            self.manager.send_text_batch(["a" + SerialManager.GROUP_SEPARATOR], 0, 0)
+
+    def test_sanitize_text_replaces_unsendable_characters(self):
+        self.assertEqual(SerialManager.sanitize_text("hello world"), "hello world")
+        self.assertEqual(SerialManager.sanitize_text("café\n—x"), "caf???x")
+
+
+class _FailingConnection:
+    """Stand-in port whose writes fail like an unplugged device."""
+    is_open = True
+
+    def __init__(self, error=None):
+        self.error = error or OSError("device disconnected")
+
+    def write(self, data):
+        raise self.error
+
+
+@unittest.skipIf(SerialManager is None, "pyserial is not installed")
+class WriteFailureTest(unittest.TestCase):
+    def test_fatal_write_error_disconnects(self):
+        manager = SerialManager(lambda line: None)
+        manager.connection = _FailingConnection()
+        manager.is_connected = True
+        manager._start_write_thread()
+
+        manager.send_text("abc", 0, 0)
+        manager._write_thread.join(timeout=1)
+
+        self.assertFalse(manager._write_thread.is_alive())
+        self.assertFalse(manager.is_connected)
+        with self.assertRaisesRegex(ConnectionError, "device disconnected"):
+            manager.send_text("abc", 0, 0)
+
+    def test_write_timeout_disconnects(self):
+        import serial
+
+        manager = SerialManager(lambda line: None)
+        manager.connection = _FailingConnection(serial.SerialTimeoutException("Write timeout"))
+        manager.is_connected = True
+        manager._start_write_thread()
+
+        manager.send_text("abc", 0, 0)
+        manager._write_thread.join(timeout=1)
+
+        self.assertFalse(manager.is_connected)
+        with self.assertRaisesRegex(ConnectionError, "Write timeout"):
+            manager.send_text("abc", 0, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()